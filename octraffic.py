@@ -13,6 +13,7 @@ from __future__ import annotations
 import os
 import sys
 import datetime
+import hashlib
 import pickle
 import textwrap
 from pathlib import Path
@@ -20,6 +21,7 @@ import json
 import re
 import logging
 import unicodedata
+from functools import partial
 from typing import Union, List, Optional, Dict, Any
 #from fontTools.misc.plistlib import Data
 import wmi
@@ -29,19 +31,39 @@ from pandas.api.types import CategoricalDtype
 import numpy as np
 import requests
 from scipy import stats
-import statsmodels.api as sm
-from statsmodels.nonparametric.smoothers_lowess import lowess
 import matplotlib.pyplot as plt
 from matplotlib.ticker import FuncFormatter
 import matplotlib.dates as mdates
 from matplotlib.patches import Rectangle, Patch
-import seaborn as sns
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
 import arcpy
 from arcpy import metadata as md
 from arcgis.features import GeoAccessor, GeoSeriesAccessor
 import codebook.cbl as cbl
 
 
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# COVID-19 Restrictions Period ----
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Start, end, and midpoint of the COVID-19 restrictions period (March 2020 - March 2022) as matplotlib date numbers (computed once)
+COVID_START_NUM = float(mdates.date2num(pd.Timestamp("2020-03-01")))
+COVID_END_NUM = float(mdates.date2num(pd.Timestamp("2022-03-01")))
+COVID_MID_NUM = 0.5 * (COVID_START_NUM + COVID_END_NUM)
+
+
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Axis Tick Formatters ----
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Format a z-score tick in the original scale (mean, std and decimals are bound with functools.partial)
+def _z_to_original_tick(x: float, pos: int, *, mean: float, std: float, decimals: int = 0) -> str:
+    return f"{x * std + mean:.{decimals}f}"
+
+
+# Format a tick with commas and no negative sign (e.g., for the two sides of a pyramid plot)
+def _abs_comma_tick(x: float, pos: int) -> str:
+    return f"{abs(x):,}"
+
 
 #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 # Define the DualOutput class for logging ----
@@ -261,7 +283,7 @@ class OCTraffic:
         13. chi2_gof_test(self, df: pd.DataFrame, col: str) -> dict
         14. kruskal_test(self, df: pd.DataFrame, col1: str, col2: str) -> dict
         15. p_value_display(self, p_value: float) -> str
-        16. create_stl_plot(self, time_series, season, model="additive", label=None, covid=False, robust=True) -> tuple
+        16. create_stl_plot(self, time_series, season, model="additive", label=None, covid=False, robust=True, fig=None, decomposition=None, cache_dir=None) -> tuple
         17. format_coll_time(self, x: int) -> str
         18. quarter_to_date(self, row: pd.Series, ts: bool = True) -> pd.Timestamp
         19. get_coll_severity_rank(self, row: pd.Series) -> int
@@ -271,14 +293,17 @@ class OCTraffic:
         23. plot_collision_type_bar(self, df: pd.DataFrame, fig: matplotlib.figure.Figure=None, ax: matplotlib.axes.Axes=None) -> tuple
         24. plot_fatalities_by_type_and_year(self, df: pd.DataFrame, fig: matplotlib.figure.Figure=None, ax: matplotlib.axes.Axes=None) -> tuple
         25. compute_monthly_stats(self, ts_month: pd.DataFrame) -> pd.DataFrame
-        26. create_monthly_fatalities_figure(self, ts_month: pd.DataFrame) -> tuple
-        27. create_victims_severity_plot(self,data: pd.DataFrame, save_path: str = None, show_plot: bool = True) -> tuple
+        26. create_monthly_fatalities_figure(self, ts_month: pd.DataFrame, dpi: int = None) -> tuple
+        27. create_victims_severity_plot(self,data: pd.DataFrame, save_path: str = None, show_plot: bool = True, trends: dict = None) -> tuple
         28. create_age_pyramid_plot(self, collisions: pd.DataFrame) -> tuple
         29. export_cim(self, cim_type: str, cim_object: object, cim_name: str) -> None
         30. set_layer_time(self, layer: arcpy.mapping.Layer) -> None
         31. layout_configuration(self, nmf: int) -> dict
         32. delete_feature_class(self, fc_name: str, gdb_path: Optional[str] = None, dataset: Optional[str] = None) -> None
         33. load_aprx(self, add_to_map: bool = True) -> tuple
+        34. grouped_rank_tests(self, df: pd.DataFrame, col1: str, col2: str) -> tuple
+        35. draw_covid_overlay(self, ax: matplotlib.axes.Axes, ymin: float, ymax: float, zorder: float = 1) -> None
+        36. compute_overlay_trends(self, data: pd.DataFrame) -> dict
     Examples:
         >>> from octraffic import octraffic
         >>> ocs = octraffic()
@@ -890,34 +915,34 @@ class OCTraffic:
         for name in df_names:
             if name in local_vars:
                 print("  - Saving the", name, "data frame:", f"{name}.pkl")
-                with open(os.path.join(dir_list["data_python"], f"{name}.pkl"), "wb") as f:
-                    pickle.dump(local_vars[name], f)
+                with open(os.path.join(dir_list["data_python"], f"{name}.pkl"), "wb", buffering = 1 << 20) as f:
+                    pickle.dump(local_vars[name], f, protocol = 5)
             elif name in global_vars:
                 print("  - Saving the", name, "data frame:", f"{name}.pkl")
-                with open(os.path.join(dir_list["data_python"], f"{name}.pkl"), "wb") as f:
-                    pickle.dump(global_vars[name], f)
+                with open(os.path.join(dir_list["data_python"], f"{name}.pkl"), "wb", buffering = 1 << 20) as f:
+                    pickle.dump(global_vars[name], f, protocol = 5)
 
         print("2. Saving the Codebook and Reference Tables to disk")
 
         # Save the codebook to disk
         if "cb" in local_vars:
             print("  - Saving the codebook to disk")
-            with open(os.path.join(dir_list["codebook"], "cb.pkl"), "wb") as f:
-                pickle.dump(local_vars["cb"], f)
+            with open(os.path.join(dir_list["codebook"], "cb.pkl"), "wb", buffering = 1 << 20) as f:
+                pickle.dump(local_vars["cb"], f, protocol = 5)
         elif "cb" in global_vars:
             print("  - Saving the codebook to disk")
-            with open(os.path.join(dir_list["codebook"], "cb.pkl"), "wb") as f:
-                pickle.dump(global_vars["cb"], f)
+            with open(os.path.join(dir_list["codebook"], "cb.pkl"), "wb", buffering = 1 << 20) as f:
+                pickle.dump(global_vars["cb"], f, protocol = 5)
 
         # Save the codebook reference table to disk
         if "df_cb" in local_vars:
             print("  - Saving the codebook reference table to disk")
-            with open(os.path.join(dir_list["codebook"], "df_cb.pkl"), "wb") as f:
-                pickle.dump(local_vars["df_cb"], f)
+            with open(os.path.join(dir_list["codebook"], "df_cb.pkl"), "wb", buffering = 1 << 20) as f:
+                pickle.dump(local_vars["df_cb"], f, protocol = 5)
         elif "df_cb" in global_vars:
             print("  - Saving the codebook reference table to disk")
-            with open(os.path.join(dir_list["codebook"], "df_cb.pkl"), "wb") as f:
-                pickle.dump(global_vars["df_cb"], f)
+            with open(os.path.join(dir_list["codebook"], "df_cb.pkl"), "wb", buffering = 1 << 20) as f:
+                pickle.dump(global_vars["df_cb"], f, protocol = 5)
         
         print("3. Export the TIMS Metadata to disk")
         
@@ -933,22 +958,22 @@ class OCTraffic:
         for name in ts_names:
             if name in local_vars:
                 print("  - Saving the", name, "data frame:", f"{name}.pkl")
-                with open(os.path.join(dir_list["data_python"], f"{name}.pkl"), "wb") as f:
-                    pickle.dump(local_vars[name], f)
+                with open(os.path.join(dir_list["data_python"], f"{name}.pkl"), "wb", buffering = 1 << 20) as f:
+                    pickle.dump(local_vars[name], f, protocol = 5)
             elif name in global_vars:
                 print("  - Saving the", name, "data frame:", f"{name}.pkl")
-                with open(os.path.join(dir_list["data_python"], f"{name}.pkl"), "wb") as f:
-                    pickle.dump(global_vars[name], f)
+                with open(os.path.join(dir_list["data_python"], f"{name}.pkl"), "wb", buffering = 1 << 20) as f:
+                    pickle.dump(global_vars[name], f, protocol = 5)
 
         # Save the graphics list to disk
         if "graphics_list" in local_vars:
             print("4. Saving the Graphics data to disk")
-            with open(os.path.join(dir_list["data_python"], "graphics_list.pkl"), "wb") as f:
-                pickle.dump(local_vars["graphics_list"], f)
+            with open(os.path.join(dir_list["data_python"], "graphics_list.pkl"), "wb", buffering = 1 << 20) as f:
+                pickle.dump(local_vars["graphics_list"], f, protocol = 5)
         elif "graphics_list" in global_vars:
             print("4. Saving the Graphics data to disk")
-            with open(os.path.join(dir_list["data_python"], "graphics_list.pkl"), "wb") as f:
-                pickle.dump(global_vars["graphics_list"], f)
+            with open(os.path.join(dir_list["data_python"], "graphics_list.pkl"), "wb", buffering = 1 << 20) as f:
+                pickle.dump(global_vars["graphics_list"], f, protocol = 5)
 
 
     #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -1203,7 +1228,7 @@ class OCTraffic:
     #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
     ## 16. Create STL Plot Function ----
     #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-    def create_stl_plot(self, time_series, season, model = "additive", label = None, covid = False, robust = True) -> tuple:
+    def create_stl_plot(self, time_series, season, model = "additive", label = None, covid = False, robust = True, fig = None, decomposition = None, cache_dir = None) -> tuple:
         """
         Create a Seasonal-Trend decomposition using LOESS (STL).
         Args:
@@ -1213,6 +1238,10 @@ class OCTraffic:
             label (str): Label for the time series (optional)
             covid (bool): Whether to show COVID-19 period annotation (March 2020 - March 2022)
             robust (bool): Whether to use the robust estimation (helps with outliers)
+            fig (matplotlib.figure.Figure): Existing figure to clear and draw on (optional, e.g., to reuse one figure across several saved plots)
+            decomposition: Precomputed decomposition result of the same series, season, model and robust settings (optional, skips the fit, e.g., to redraw a series with the COVID-19 annotation)
+            cache_dir (str): Directory of cached decomposition results (optional). Results are keyed by a hash of the series values and dates,
+                the decomposition settings and the statsmodels, pandas and numpy versions, so a cached fit is only reused while all of them are unchanged
         Returns:
             tuple: (decomposition_result, figure)
         Raises:
@@ -1222,6 +1251,10 @@ class OCTraffic:
         Notes:
             This function creates a Seasonal-Trend decomposition using LOESS (STL).
         """
+        # Import the decomposition functions here (statsmodels is slow to import and only needed for the time series plots)
+        import statsmodels
+        from statsmodels.tsa.seasonal import STL, seasonal_decompose
+
         # Check the seasonality and set the period and model accordingly
         period = None
         footnote = None
@@ -1242,18 +1275,49 @@ class OCTraffic:
                 raise ValueError("Seasonality must be one of: quarterly, monthly, weekly, daily.")
 
         # set the title for the original time series
-        original_title = f"Original Time Series: {label}" if label else "Original Time Series"  # Perform STL decomposition
-        if robust:
+        original_title = f"Original Time Series: {label}" if label else "Original Time Series"
+
+        # Look up the decomposition in the on-disk cache (keyed by a hash of the series values and dates, the decomposition settings,
+        # and the statsmodels, pandas and numpy versions, so entries written by other library versions are not reused)
+        cache_path = None
+        if decomposition is None and cache_dir is not None:
+            key = hashlib.blake2b(digest_size = 16)
+            key.update(pd.util.hash_pandas_object(time_series, index = True).to_numpy().tobytes())
+            key.update(f"{'STL' if robust else 'seasonal_decompose'}|{period}|{model}".encode("utf-8"))
+            key.update(f"{statsmodels.__version__}|{pd.__version__}|{np.__version__}".encode("utf-8"))
+            cache_path = os.path.join(cache_dir, f"stl_{key.hexdigest()}.pkl")
+            if os.path.isfile(cache_path):
+                with open(cache_path, "rb") as f:
+                    decomposition = pickle.load(f)
+
+        # Perform STL decomposition (unless it was provided or cached)
+        if decomposition is not None:
+            # Reuse the provided or cached decomposition result
+            pass
+        elif robust:
             # Use STL for robust decomposition
-            stl = sm.tsa.STL(time_series, period = period)
+            stl = STL(time_series, period = period)
             decomposition = stl.fit()
         else:
             # Use seasonal_decompose for non-robust decomposition
-            decomposition = sm.tsa.seasonal_decompose(
+            decomposition = seasonal_decompose(
                 time_series, period = period, model = model
-            )  # Create figure with subplots for original, trend, seasonal, and residual
-        fig = plt.figure(figsize = (12, 10))  # Plot original time series
-        ax1 = plt.subplot(411)
+            )
+
+        # Store a newly computed decomposition in the cache (written to a temporary file first, so an interrupted run leaves no partial entry)
+        if cache_path is not None and not os.path.isfile(cache_path):
+            os.makedirs(cache_dir, exist_ok = True)
+            with open(cache_path + ".tmp", "wb", buffering = 1 << 20) as f:
+                pickle.dump(decomposition, f, protocol = 5)
+            os.replace(cache_path + ".tmp", cache_path)
+
+        # Create (or clear the provided) figure with subplots for original, trend, seasonal, and residual
+        if fig is None:
+            fig = plt.figure(figsize = (12, 10))
+        else:
+            fig.clear()
+        # Plot original time series
+        ax1 = fig.add_subplot(411)
         ax1.plot(time_series, color = "royalblue")
         ax1.set_title(original_title, fontweight = "bold")
         # Format y-axis values based on their magnitude
@@ -1267,7 +1331,7 @@ class OCTraffic:
         # Remove top and right spines
         ax1.spines["top"].set_visible(False)
         ax1.spines["right"].set_visible(False)  # Plot trend component
-        ax2 = plt.subplot(412)
+        ax2 = fig.add_subplot(412)
         ax2.plot(
             decomposition.trend, color = "brown", linewidth = 3
         )  # Increased line thickness
@@ -1283,7 +1347,7 @@ class OCTraffic:
         # Remove top and right spines
         ax2.spines["top"].set_visible(False)
         ax2.spines["right"].set_visible(False)  # Plot seasonal component
-        ax3 = plt.subplot(413)
+        ax3 = fig.add_subplot(413)
         ax3.plot(decomposition.seasonal, color = "darkgreen")
         ax3.set_title("Seasonal Component", fontweight = "bold")
         # Format y-axis values based on their magnitude
@@ -1299,7 +1363,7 @@ class OCTraffic:
         ax3.spines["right"].set_visible(False)
 
         # Plot residual component
-        ax4 = plt.subplot(414)
+        ax4 = fig.add_subplot(414)
         ax4.plot(decomposition.resid, color = "purple")
         ax4.set_title("Residual Component", fontweight = "bold")
         # Format y-axis values based on their magnitude
@@ -1320,43 +1384,22 @@ class OCTraffic:
 
         # Add COVID-19 period annotation if requested
         if covid:
-            # Define COVID-19 period
-            covid_start = pd.to_datetime("2020-03-01")
-            covid_end = pd.to_datetime("2022-03-01")
-            covid_start_num = float(mdates.date2num(covid_start))
-            covid_end_num = float(mdates.date2num(covid_end))
-
             # First pass to adjust y-limits to fit all data
             for ax in [ax1, ax2, ax3, ax4]:
                 # Force matplotlib to calculate the limits
                 ax.relim()
                 ax.autoscale_view()
 
-            # Add the COVID-19 reference boxes to each subplot
+            # Add the COVID-19 reference boxes (spanning the entire height, behind the data) and lines to each subplot
             for ax in [ax1, ax2, ax3, ax4]:
                 # Get the ylim after we've forced matplotlib to calculate them
                 ymin, ymax = ax.get_ylim()
-                # Add the shaded region with proper height
-                rect = Rectangle(
-                    (covid_start_num, ymin),  # Start at the bottom of the plot
-                    covid_end_num - covid_start_num,
-                    ymax - ymin,  # Span the entire height
-                    facecolor = "green",
-                    alpha = 0.2,
-                    zorder = 0,  # Ensure it's behind the data
-                )
-                ax.add_patch(rect)
-
-                # Add the reference lines
-                ax.axvline(x = covid_start_num, linewidth = 0.5, linestyle = "dashed", color = "darkgreen")
-                ax.axvline(x = covid_end_num, linewidth = 0.5, linestyle = "dashed", color = "darkgreen")
+                self.draw_covid_overlay(ax, ymin, ymax, zorder = 0)
 
             # Add the annotation text only to the first subplot
-            covid_mid_dt = covid_start + (covid_end - covid_start) / 2
-            covid_mid_num = float(mdates.date2num(covid_mid_dt))
             ax1.annotate(
                 "COVID-19\nRestrictions",
-                xy = (covid_mid_num, ax1.get_ylim()[1] * 0.85),
+                xy = (COVID_MID_NUM, ax1.get_ylim()[1] * 0.85),
                 xycoords = "data",
                 ha = "center",
                 fontsize = 10,
@@ -1366,7 +1409,7 @@ class OCTraffic:
             )
 
         # Adjust layout
-        plt.tight_layout()
+        fig.tight_layout()
 
         # Add footnote at the bottom left of the plot
         # if footnote is a single string, add it to the figure
@@ -1601,6 +1644,9 @@ class OCTraffic:
         Notes:
             This function plots a histogram for the top 10 victim frequency counts.
         """
+        # Import seaborn here (only the plotting functions need it, so importing the module stays fast)
+        import seaborn as sns
+
         if "victim_count" not in df.columns:
             raise KeyError("The DataFrame must contain a 'victim_count' column.")
 
@@ -1666,6 +1712,9 @@ class OCTraffic:
         Notes:
             This function plots a bar graph of collision types from the crashes DataFrame.
         """
+        # Lazy import
+        import seaborn as sns
+
         if "type_of_coll" not in df.columns:
             raise KeyError("'type_of_coll' column not found in DataFrame.")
         # Prepare the data for plotting
@@ -1727,6 +1776,9 @@ class OCTraffic:
         Notes:
             This function plots a stacked bar chart of fatalities by type and year.
         """
+        # Lazy import
+        import seaborn as sns
+
         fig3_data = df[
             ["date_year", "count_car_killed_sum", "count_ped_killed_sum", "count_bic_killed_sum", "count_mc_killed_sum"]
         ].copy()
@@ -1887,11 +1939,12 @@ class OCTraffic:
     #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
     ## 26. Create Monthly Fatalities Figure ----
     #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-    def create_monthly_fatalities_figure(self, ts_month: pd.DataFrame) -> tuple:
+    def create_monthly_fatalities_figure(self, ts_month: pd.DataFrame, dpi: int = None) -> tuple:
         """
         Creates a time series plot of monthly fatal crashes with LOESS smoothing and CI.
         Args:
             ts_month (pd.DataFrame): DataFrame containing monthly time series data with crashes
+            dpi (int, optional): Resolution to create the figure at (e.g., the output resolution when the figure is only saved). Defaults to None (the matplotlib default).
         Returns:
             fig, ax: The figure and axes objects for further customization if needed
         Raises:
@@ -1903,37 +1956,29 @@ class OCTraffic:
         Notes:
             This function creates a time series plot of monthly fatal crashes with LOESS smoothing and CI.
         """
+        # Lazy imports
+        import seaborn as sns
+        from statsmodels.nonparametric.smoothers_lowess import lowess
+
         # Define the time series data for Figure 4 (monthly number of killed victims)
         fig4_data = ts_month["crashes"][["date_month", "number_killed_sum"]]
         fig4_data.columns = ["time", "fatalities"]
 
         # Create the time series overlay plot for the monthly number of killed victims
-        fig4, ax = plt.subplots(figsize = (12, 8))
+        # (the only pyplot call: the figure stays registered so that callers can still show and close it; everything else uses the figure and axes objects)
+        fig4, ax = plt.subplots(figsize = (12, 8), dpi = dpi)
 
         # Set initial y-limits based on data to avoid the Rectangle error
         y_max_value = fig4_data["fatalities"].max()
         ax.set_ylim(0, y_max_value)
 
-        # First, add the Covid-19 restrictions area of interest annotation layer (behind everything else)
-        covid_start = pd.to_datetime("2020-03-01")
-        covid_end = pd.to_datetime("2022-03-01")
-        covid_start_num = float(mdates.date2num(covid_start))
-        covid_end_num = float(mdates.date2num(covid_end))
-        rect = Rectangle(
-            (covid_start_num, 0), covid_end_num - covid_start_num, float(ax.get_ylim()[1]), facecolor = "green", alpha = 0.2
-        )
-        ax.add_patch(rect)
-
-        # Add the covid-19 reference lines (left and right)
-        ax.axvline(x = covid_start_num, linewidth = 0.5, linestyle = "dashed", color = "darkgreen")
-        ax.axvline(x = covid_end_num, linewidth = 0.5, linestyle = "dashed", color = "darkgreen")
+        # First, add the Covid-19 restrictions area of interest annotation layer and its reference lines (behind everything else)
+        self.draw_covid_overlay(ax, 0, float(ax.get_ylim()[1]))
 
         # Add the covid-19 reference text annotation
-        covid_mid_dt = covid_start + (covid_end - covid_start) / 2
-        covid_mid_num = float(mdates.date2num(covid_mid_dt))
         ax.annotate(
             "COVID-19\nRestrictions",
-            xy = (covid_mid_num, 2),
+            xy = (COVID_MID_NUM, 2),
             xycoords = "data",
             ha = "center",
             fontsize = 10,
@@ -1946,19 +1991,20 @@ class OCTraffic:
         ax.plot(fig4_data["time"], fig4_data["fatalities"], color = "navy", linewidth = 1.5, alpha = 0.6)
 
         # Add the smoothed LOESS trend line for the number of killed victims
-        # Compute LOWESS
-        lowess_result = lowess(fig4_data["fatalities"], mdates.date2num(fig4_data["time"]), frac = 0.2, return_sorted = True)
+        # Compute LOWESS (the monthly dates are already in ascending order, so the internal sort is skipped)
+        date_nums = mdates.date2num(fig4_data["time"].to_numpy())
+        lowess_result = lowess(fig4_data["fatalities"].to_numpy(), date_nums, frac = 0.2, return_sorted = True, is_sorted = True)
 
         # Calculate 95% confidence intervals for LOESS
         lowess_x = lowess_result[:, 0]
         lowess_y = lowess_result[:, 1]
-        residuals = []
 
-        # Calculate residuals for each point
-        for i, date_num in enumerate(mdates.date2num(fig4_data["time"])):
-            # Find closest point in lowess_result
-            idx = (np.abs(lowess_x - date_num)).argmin()
-            residuals.append(fig4_data["fatalities"].iloc[i] - lowess_y[idx])
+        # Find the closest point in lowess_result for each date (both are sorted, so a binary search replaces the per-point scan)
+        idx = np.clip(np.searchsorted(lowess_x, date_nums), 1, len(lowess_x) - 1)
+        idx = np.where(np.abs(lowess_x[idx] - date_nums) < np.abs(lowess_x[idx - 1] - date_nums), idx, idx - 1)
+
+        # Calculate residuals for all points at once
+        residuals = fig4_data["fatalities"].to_numpy() - lowess_y[idx]
 
         # Calculate standard error and confidence interval
         std_error = np.std(residuals)
@@ -1972,13 +2018,11 @@ class OCTraffic:
         mean_ci_upper = lowess_y + mean_ci_width
         mean_ci_lower = lowess_y - mean_ci_width
 
-        # Plot the 95% CI for the mean as a filled area
-        ax.fill_between(
-            mdates.num2date(lowess_x), mean_ci_lower, mean_ci_upper, color = "orange", alpha = 0.4, label = "95% CI for Mean"
-        )
+        # Plot the 95% CI for the mean as a filled area (the x-axis is already a date axis, so the date numbers are used directly)
+        ax.fill_between(lowess_x, mean_ci_lower, mean_ci_upper, color = "orange", alpha = 0.4, label = "95% CI for Mean")
 
         # Plot the smoothed trend line
-        ax.plot(mdates.num2date(lowess_result[:, 0]), lowess_result[:, 1], color = "darkred", linewidth = 3)
+        ax.plot(lowess_x, lowess_y, color = "darkred", linewidth = 3)
 
         # Set the graph labels
         ax.set_xlabel("Date", fontsize = 16)
@@ -2007,14 +2051,24 @@ class OCTraffic:
         # Set all tick positions with marks every 5 units
         ax.set_yticks(all_ticks)
 
-        # Draw gridlines only at specific positions (5, 15, 25) - thin and dashed
-        for pos in gridline_positions:
-            ax.axhline(y = pos, color = 'gray', linestyle = '--', linewidth = 0.7, alpha = 0.7, zorder = 0)
+        # Draw gridlines only at specific positions (5, 15, 25) - thin and dashed, as one collection spanning the axes width
+        ax.add_collection(
+            LineCollection(
+                [[(0, pos), (1, pos)] for pos in gridline_positions],
+                colors = "gray",
+                linestyles = "--",
+                linewidths = 0.7,
+                alpha = 0.7,
+                zorder = 0,
+                transform = ax.get_yaxis_transform(),
+            ),
+            autolim = False,
+        )
 
         # Set up the legend
         legend_elements = [
-            plt.Line2D([0], [0], color = "navy", lw = 1, alpha = 0.6, label = "Number of Killed Victims"),
-            plt.Line2D([0], [0], color = "darkred", lw = 2, label = "Fatalities Trend (Lowess)"),
+            Line2D([0], [0], color = "navy", lw = 1, alpha = 0.6, label = "Number of Killed Victims"),
+            Line2D([0], [0], color = "darkred", lw = 2, label = "Fatalities Trend (Lowess)"),
             Patch(facecolor = "orange", alpha = 0.1, label = "95% CI for Mean"),
         ]
         ax.legend(
@@ -2027,8 +2081,8 @@ class OCTraffic:
             fontsize = 12,
         )
 
-        # Display the time series plot for the monthly number of victims killed
-        plt.tight_layout()
+        # Display the time series plot for the monthly number of victims killed (laid out on this figure, not on pyplot's current figure)
+        fig4.tight_layout()
 
         # Return the figure and axes for further customization if needed
         return fig4, ax
@@ -2036,7 +2090,7 @@ class OCTraffic:
     #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
     ## 27. Create Victims vs Severity Overlay Plot Function ----
     #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-    def create_victims_severity_plot(self,data: pd.DataFrame, save_path: str = None, show_plot: bool = True) -> tuple:
+    def create_victims_severity_plot(self,data: pd.DataFrame, save_path: str = None, show_plot: bool = True, trends: dict = None) -> tuple:
         """Creates a time series overlay plot of victims vs collision severity.
         This function creates a dual-axis plot showing the number of victims and
         mean collision severity over time, including LOESS trend lines and
@@ -2050,6 +2104,8 @@ class OCTraffic:
                 z_severity: standardized severity values
             save_path: Optional path to save the figure. If None, the figure is not saved.
             show_plot: Boolean indicating whether to display the plot. Default is True.
+            trends: Optional dictionary of precomputed LOESS trends and confidence bounds (see compute_overlay_trends).
+                If None, the trends are computed from the data.
         Returns:
             tuple: (fig, ax1, ax2) containing the figure and axis objects
         Raises:
@@ -2065,42 +2121,40 @@ class OCTraffic:
         required_cols = ["time", "victims", "severity", "z_victims", "z_severity"]
         for col in required_cols:
             if col not in data.columns:
-                raise ValueError(f"Required column '{col}' not found in input data")  # Create the time series overlay plot
-        fig, ax1 = plt.subplots(figsize = (12, 8))
+                raise ValueError(f"Required column '{col}' not found in input data")
 
-        # Remove all gridlines for cleaner look
-        ax1.grid(False)
-
-        # Convert date columns to matplotlib date format if they aren't already
+        # Convert date columns to matplotlib date format if they aren't already (on a new frame, so the caller's data is not modified)
         if not pd.api.types.is_datetime64_any_dtype(data["time"]):
-            data["time"] = pd.to_datetime(data["time"])
+            data = data.assign(time = pd.to_datetime(data["time"]))
 
-        # Add the Covid-19 restrictions area of interest annotation layer
-        covid_start = pd.to_datetime("2020-03-01")
-        covid_end = pd.to_datetime("2022-03-01")
+        # Compute the LOESS trends and confidence bounds unless they were precomputed by the caller
+        if trends is None:
+            trends = self.compute_overlay_trends(data)
 
-        # Convert to numerical format that matplotlib can use - ensure float types
-        covid_start_num = float(mdates.date2num(covid_start))
-        covid_end_num = float(mdates.date2num(covid_end))
+        # Create the time series overlay plot (constrained layout packs the figure while drawing, replacing a separate tight_layout pass)
+        fig, ax1 = plt.subplots(figsize = (12, 8), layout = "constrained")
 
+        # Remove all gridlines for cleaner look
+        ax1.grid(False)
+
+        # Add the Covid-19 restrictions area of interest annotation layer (precomputed date numbers)
         # Create the shaded background for COVID period
-        ax1.axvspan(covid_start_num, covid_end_num, alpha = 0.2, color = "green")
+        ax1.axvspan(COVID_START_NUM, COVID_END_NUM, alpha = 0.2, color = "green")
 
         # Add the covid-19 reference lines (left and right)
-        ax1.axvline(x = covid_start_num, linewidth = 0.5, linestyle = "dashed", color = "darkgreen")
+        ax1.axvline(x = COVID_START_NUM, linewidth = 0.5, linestyle = "dashed", color = "darkgreen")
         ax1.axvline(
-            x = covid_end_num, linewidth = 0.5, linestyle = "dashed", color = "darkgreen"
+            x = COVID_END_NUM, linewidth = 0.5, linestyle = "dashed", color = "darkgreen"
         )  # Add the covid-19 reference text annotation
-        covid_mid = covid_start + (covid_end - covid_start) / 2
-        covid_mid_num = float(mdates.date2num(covid_mid))
 
         # Calculate proper position for the text annotation at bottom of plot
         # First, get current data view limits rather than axis limits
         # which might not be set until after plotting
-        ymin = min(data["z_victims"].min(), data["z_severity"].min()) - 0.5
+        # (one NaN-aware NumPy reduction over both z-score columns)
+        ymin = float(np.nanmin(data[["z_victims", "z_severity"]].to_numpy(dtype = float))) - 0.5
 
         ax1.text(
-            x = covid_mid_num,
+            x = COVID_MID_NUM,
             y = ymin + 0.25,
             s = "COVID-19\nRestrictions",
             fontweight = "bold",
@@ -2112,62 +2166,36 @@ class OCTraffic:
         )
 
         # Add the time series line for the number of victims (primary axis)
-        ax1.plot(data["time"], data["z_victims"], color = "royalblue", linewidth = 0.85, alpha = 0.4, label = "Number of Victims")
+        # (the dense raw series and the confidence bands are rasterized, so vector outputs embed them as images; the trend lines stay vectors)
+        ax1.plot(
+            data["time"], data["z_victims"], color = "royalblue", linewidth = 0.85, alpha = 0.4, label = "Number of Victims", rasterized = True
+        )
 
         # Create a second y-axis for severity
         ax2 = ax1.twinx()
         ax2.plot(
-            data["time"], data["z_severity"], color = "darkorange", linewidth = 0.85, alpha = 0.4, label = "Mean Severity Rank"
+            data["time"], data["z_severity"], color = "darkorange", linewidth = 0.85, alpha = 0.4, label = "Mean Severity Rank", rasterized = True
         )  # Add LOESS trend lines (equivalent to R's geom_smooth)
-        # For victims trend (using statsmodels lowess)
-        # Convert datetime to float for lowess calculation
-        time_numeric = mdates.date2num(data["time"].values)  # Calculate LOESS trend for victims
-        lowess_victims = sm.nonparametric.lowess(data["z_victims"].values, time_numeric, frac = 0.2)
-
-        # Calculate 95% confidence intervals for the LOESS mean estimates
-        # Use standard error of the mean (SEM) rather than standard deviation of residuals
-        residuals_victims = data["z_victims"].values - np.interp(time_numeric, lowess_victims[:, 0], lowess_victims[:, 1])
-        sem_victims = np.std(residuals_victims) / np.sqrt(len(residuals_victims))
-        ci_width_victims = 1.96 * sem_victims  # 95% CI is 1.96 * standard error of mean
-
-        # Create upper and lower bounds for victims confidence interval around the trend line
-        upper_victims = lowess_victims[:, 1] + ci_width_victims
-        lower_victims = lowess_victims[:, 1] - ci_width_victims
 
         # Add shaded confidence interval for victims trend
-        ax1.fill_between(mdates.num2date(lowess_victims[:, 0]), lower_victims, upper_victims, color = "navy", alpha = 0.2)
+        ax1.fill_between(trends["victims_x"], trends["victims_lo"], trends["victims_hi"], color = "navy", alpha = 0.2, rasterized = True)
 
         # Plot the victims trend line on top of confidence interval
         ax1.plot(
-            mdates.num2date(lowess_victims[:, 0]),
-            lowess_victims[:, 1],
+            trends["victims_x"],
+            trends["victims_y"],
             color = "navy",
             linewidth = 2.5,
             label = "Victims Loess\nRegression Trend (95% CI)",
         )
 
-        # For severity trend
-        lowess_severity = sm.nonparametric.lowess(
-            data["z_severity"].values, time_numeric, frac = 0.2
-        )  # Calculate 95% confidence intervals for severity LOESS
-        # Use standard error of the mean (SEM) rather than standard deviation of residuals
-        residuals_severity = data["z_severity"].values - np.interp(
-            time_numeric, lowess_severity[:, 0], lowess_severity[:, 1]
-        )
-        sem_severity = np.std(residuals_severity) / np.sqrt(len(residuals_severity))
-        ci_width_severity = 1.96 * sem_severity  # 95% CI is 1.96 * standard error of mean
-
-        # Create upper and lower bounds for severity confidence interval around the trend line
-        upper_severity = lowess_severity[:, 1] + ci_width_severity
-        lower_severity = lowess_severity[:, 1] - ci_width_severity
-
         # Add shaded confidence interval for severity trend
-        ax2.fill_between(mdates.num2date(lowess_severity[:, 0]), lower_severity, upper_severity, color = "maroon", alpha = 0.2)
+        ax2.fill_between(trends["severity_x"], trends["severity_lo"], trends["severity_hi"], color = "maroon", alpha = 0.2, rasterized = True)
 
         # Plot the severity trend line on top of confidence interval
         ax2.plot(
-            mdates.num2date(lowess_severity[:, 0]),
-            lowess_severity[:, 1],
+            trends["severity_x"],
+            trends["severity_y"],
             color = "maroon",
             linewidth = 2.5,
             label = "Severity Loess\nRegression Trend (95% CI)",
@@ -2183,27 +2211,15 @@ class OCTraffic:
         # Add light grid lines for major (year) ticks only on the x-axis
         ax1.grid(axis = "x", which = "major", linestyle = "--", linewidth = 0.5, color = "gray", alpha = 0.7)
 
-        # Define function to convert z-scores back to original scale
-        def z_to_original(z, original_mean, original_std):
-            return z * original_std + original_mean
-
         # Set up formatters for the y-axes to convert z-scores back to original values
-        victims_mean = data["victims"].mean()
-        victims_std = data["victims"].std()
-        severity_mean = data["severity"].mean()
-        severity_std = data["severity"].std()
-
-        # Function to format y-axis ticks for victims
-        def victims_formatter(x, pos):
-            return f"{z_to_original(x, victims_mean, victims_std):.0f}"
+        # (column-wise NaN-aware sample mean and standard deviation on the NumPy array, matching the pandas defaults)
+        raw_values = data[["victims", "severity"]].to_numpy(dtype = float)
+        victims_mean, severity_mean = np.nanmean(raw_values, axis = 0)
+        victims_std, severity_std = np.nanstd(raw_values, axis = 0, ddof = 1)
 
-        # Function to format y-axis ticks for severity
-        def severity_formatter(x, pos):
-            return f"{z_to_original(x, severity_mean, severity_std):.2f}"
-
-        # Apply formatters to axes
-        ax1.yaxis.set_major_formatter(FuncFormatter(victims_formatter))
-        ax2.yaxis.set_major_formatter(FuncFormatter(severity_formatter))
+        # Apply formatters to axes (module-level z-score tick formatters bound to each series' mean and standard deviation)
+        ax1.yaxis.set_major_formatter(FuncFormatter(partial(_z_to_original_tick, mean = victims_mean, std = victims_std, decimals = 0)))
+        ax2.yaxis.set_major_formatter(FuncFormatter(partial(_z_to_original_tick, mean = severity_mean, std = severity_std, decimals = 2)))
 
         # Set axis labels
         ax1.set_xlabel("Date", fontsize = 15, color = "black")
@@ -2247,12 +2263,9 @@ class OCTraffic:
         # Remove gridlines for the second y-axis (severity axis)
         ax2.grid(False)
 
-        # Adjust the layout
-        plt.tight_layout()
-
         # Save the figure if path is provided
         if save_path is not None:
-            plt.savefig(save_path, dpi = 300)
+            fig.savefig(save_path, dpi = 300)
 
         # Show the plot if requested
         if show_plot:
@@ -2278,48 +2291,26 @@ class OCTraffic:
         Notes:
             The age pyramid plot is a horizontal bar chart that shows the distribution of parties and victims by age.
         """
-        # Select the party and victim age from the collision data
-        fig9a_data = collisions[["party_age", "victim_age"]]
-
-        # Create a table of the party and victim age
-        party_counts = fig9a_data["party_age"].value_counts().reset_index()
-        party_counts.columns = ["Age", "Freq"]
-        party_counts["Type"] = "Party"
-
-        victim_counts = fig9a_data["victim_age"].value_counts().reset_index()
-        victim_counts.columns = ["Age", "Freq"]
-        victim_counts["Type"] = "Victim"
-
-        # Combine the data
-        fig9a_data = pd.concat([party_counts, victim_counts])
-
-        # Convert the age column to integers
-        fig9a_data["Age"] = fig9a_data["Age"].astype(int)
-
-        # Remove all rows that are NA
-        fig9a_data = fig9a_data.dropna(subset = ["Age", "Freq"])
-
-        # Remove all rows with age > 100
-        fig9a_data = fig9a_data[fig9a_data["Age"] <= 100]
+        # Create a wide table of the party and victim age counts indexed by age, 32-bit integer counts
+        # (NA ages and ages > 100 are removed first, so the remaining ages are counted as 8-bit integers)
+        fig9a_data = (
+            collisions[["party_age", "victim_age"]]
+            .apply(lambda x: x[x <= 100].astype(np.int8).value_counts())
+            .fillna(0)
+            .astype(np.int32)
+            .sort_index()
+        )
 
         # Create figure for the plot
         fig, ax = plt.subplots(figsize = (12, 10))
 
-        # Plot party data (negative values)
-        party_data = fig9a_data[fig9a_data["Type"] == "Party"]
-        victim_data = fig9a_data[fig9a_data["Type"] == "Victim"]
-
-        # Create bar plots
-        ax.barh(party_data["Age"], -party_data["Freq"], color = "royalblue", label = "Party Age")
-        ax.barh(victim_data["Age"], victim_data["Freq"], color = "darkorange", label = "Victim Age")
+        # Create bar plots (party data as negative values)
+        ax.barh(fig9a_data.index, -fig9a_data["party_age"].to_numpy(), color = "royalblue", label = "Party Age")
+        ax.barh(fig9a_data.index, fig9a_data["victim_age"].to_numpy(), color = "darkorange", label = "Victim Age")
 
         # Format x-axis labels with commas and no negative signs
-        def abs_comma(x, pos):
-            result = f"{abs(x):,}" 
-            return result
-
-        ax.xaxis.set_major_formatter(FuncFormatter(abs_comma))  # Set axis limits
-        max_freq = max(fig9a_data["Freq"].max(), fig9a_data["Freq"].max())
+        ax.xaxis.set_major_formatter(FuncFormatter(_abs_comma_tick))  # Set axis limits
+        max_freq = int(fig9a_data.to_numpy().max())
         ax.set_xlim(-max_freq, max_freq)
         ax.set_ylim(0, 100)
         ax.set_yticks(range(0, 101, 20))
@@ -2837,6 +2828,163 @@ class OCTraffic:
         return aprx, workspace
 
 
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## 34. Grouped Chi-squared and Kruskal-Wallis Tests Function ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def grouped_rank_tests(self, df: pd.DataFrame, col1: str, col2: str) -> tuple:
+        """
+        Perform the Chi-squared test of independence and the Kruskal-Wallis H-test from a single grouping pass.
+        Args:
+            df (pd.DataFrame): The DataFrame containing the data.
+            col1 (str): The name of the column containing the values to compare (e.g., 'victim_count').
+            col2 (str): The name of the column containing the grouping variable (e.g., 'severity').
+        Returns:
+            tuple: (chi2_result, kruskal_result) dictionaries, each containing the test name, statistic, p-value, p-value display, and number of observations.
+        Raises:
+            KeyError: If required columns are missing.
+        Examples:
+            >>> parties_chi2, parties_kw = grouped_rank_tests(df, "party_count", "severity")
+        Notes:
+            This function returns the same results as chi2_test(df, col1, col2) and kruskal_test(df, col1, col2), but factorizes the value and grouping columns only once and builds both the contingency table and the Kruskal-Wallis samples from the same integer codes.
+        """
+        # Factorize both columns once (missing values and groups get the code -1)
+        value_codes, _ = pd.factorize(df[col1], sort = True)
+        group_codes, _ = pd.factorize(df[col2], sort = True)
+        n_groups = int(group_codes.max()) + 1
+        n_values = int(value_codes.max()) + 1
+
+        # Build the contingency table (values x groups) from the combined codes of the rows with both a value and a group,
+        # dropping all-zero rows and columns (as pd.crosstab does)
+        paired = (value_codes >= 0) & (group_codes >= 0)
+        contingency_table = np.bincount(
+            value_codes[paired] * n_groups + group_codes[paired], minlength = n_values * n_groups
+        ).reshape(n_values, n_groups)
+        contingency_table = contingency_table[contingency_table.any(axis = 1)][:, contingency_table.any(axis = 0)]
+        chi2 = stats.chi2_contingency(contingency_table)
+
+        # Split the values into one sample per group using a stable sort on the group codes
+        # (only rows with a missing group are skipped, as groupby does; missing values are kept, as in kruskal_test)
+        grouped = group_codes >= 0
+        order = np.argsort(group_codes[grouped], kind = "stable")
+        values = df[col1].to_numpy()[grouped][order]
+        edges = np.flatnonzero(np.diff(group_codes[grouped][order])) + 1
+        kw = stats.kruskal(*np.split(values, edges))
+
+        n = len(df)
+        chi2_result = {
+            "test": "Chi-squared test of independence",
+            "statistic": chi2.statistic,
+            "p-value": chi2.pvalue,
+            "p-value_display": self.p_value_display(chi2.pvalue),
+            "observations": n,
+        }
+        kw_result = {
+            "test": "Kruskal-Wallis H-test",
+            "statistic": kw.statistic,
+            "p-value": kw.pvalue,
+            "p-value_display": self.p_value_display(kw.pvalue),
+            "observations": n,
+        }
+        return chi2_result, kw_result
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## 35. Draw COVID-19 Overlay Function ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def draw_covid_overlay(self, ax, ymin: float, ymax: float, zorder: float = 1) -> None:
+        """
+        Draws the COVID-19 restrictions period (March 2020 - March 2022) as a shaded area with dashed reference lines.
+        Args:
+            ax (matplotlib.axes.Axes): Axes with a date x-axis to draw on
+            ymin (float): Bottom of the shaded area
+            ymax (float): Top of the shaded area
+            zorder (float): Drawing order of the shaded area (default is 1, the matplotlib patch default)
+        Returns:
+            None
+        Example:
+            >>> ocs.draw_covid_overlay(ax, *ax.get_ylim(), zorder = 0)
+        Notes:
+            The period bounds are the precomputed module-level date numbers (COVID_START_NUM, COVID_END_NUM).
+        """
+        # Add the shaded region
+        ax.add_patch(
+            Rectangle(
+                (COVID_START_NUM, ymin), COVID_END_NUM - COVID_START_NUM, ymax - ymin, facecolor = "green", alpha = 0.2, zorder = zorder
+            )
+        )
+
+        # Add the reference lines (left and right)
+        ax.axvline(x = COVID_START_NUM, linewidth = 0.5, linestyle = "dashed", color = "darkgreen")
+        ax.axvline(x = COVID_END_NUM, linewidth = 0.5, linestyle = "dashed", color = "darkgreen")
+
+
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    ## 36. Compute Overlay Trends Function ----
+    #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    def compute_overlay_trends(self, data: pd.DataFrame) -> dict:
+        """
+        Computes the LOESS trends and 95% confidence bounds for the victims vs severity overlay plot.
+        Args:
+            data (pd.DataFrame): DataFrame with the time, z_victims and z_severity columns (see create_victims_severity_plot)
+        Returns:
+            dict: The trend matplotlib date numbers (victims_x, severity_x), trend values (victims_y, severity_y),
+                and lower and upper confidence bounds (victims_lo, victims_hi, severity_lo, severity_hi)
+        Raises:
+            KeyError: If the time or z-score columns are missing
+        Example:
+            >>> trends = ocs.compute_overlay_trends(fig8_data)
+            >>> fig8, ax1, ax2 = ocs.create_victims_severity_plot(fig8_data, trends = trends)
+        Notes:
+            The confidence bounds use the standard error of the mean (SEM) of the LOESS residuals,
+            rather than the standard deviation of the residuals. The trend x values are kept as date numbers,
+            which plot directly on a date axis (no conversion back to datetime objects).
+            Missing z-scores are skipped, so each series returns its trend at its finite points only.
+        """
+        # Import the LOWESS smoother here (statsmodels is slow to import and only needed for the time series plots)
+        from statsmodels.nonparametric.smoothers_lowess import lowess
+
+        # Convert datetime to float for lowess calculation (vectorized on the datetime64 array)
+        time_numeric = mdates.date2num(data["time"].to_numpy(dtype = "datetime64[ns]"))
+
+        # Sort the dates once in ascending order (a no-op reordering for the weekly series, which are already sorted)
+        order = np.argsort(time_numeric, kind = "stable")
+        time_numeric = time_numeric[order]
+
+        # Stack both z-score series as the columns of one (n, 2) array (victims, severity), in the same date order
+        z_values = data[["z_victims", "z_severity"]].to_numpy(dtype = float)[order]
+
+        # Mark the finite points of each series (the LOESS fits skip missing z-scores)
+        finite = np.isfinite(z_values)
+
+        # Calculate the LOESS trend of each series on its finite points (equivalent to R's geom_smooth; the dates are sorted above, so the internal sort is skipped)
+        # (the fitted values are written back one-to-one with the input points, leaving NaN at the missing ones, so they keep the same (n, 2) layout)
+        fitted = np.full_like(z_values, np.nan)
+        for i in range(2):
+            fitted[finite[:, i], i] = lowess(
+                z_values[finite[:, i], i], time_numeric[finite[:, i]], frac = 0.2, is_sorted = True, return_sorted = False
+            )
+
+        # Calculate 95% confidence intervals for the LOESS mean estimates of both series at once (ignoring the missing points)
+        residuals = z_values - fitted
+        ci_width = 1.96 * np.nanstd(residuals, axis = 0) / np.sqrt(finite.sum(axis = 0))  # 95% CI is 1.96 * standard error of mean
+
+        # Write the lower and upper bounds of both series into one preallocated (2, n, 2) buffer
+        bounds = np.empty((2,) + fitted.shape)
+        np.subtract(fitted, ci_width, out = bounds[0])
+        np.add(fitted, ci_width, out = bounds[1])
+
+        # Store the trend date numbers, values, and lower and upper bounds of each series at its finite points
+        # (column views into the buffers when nothing is missing, so the trend lines are drawn without gaps)
+        trends = {}
+        for i, name in enumerate(["victims", "severity"]):
+            rows = slice(None) if finite[:, i].all() else finite[:, i]
+            trends[f"{name}_x"] = time_numeric[rows]
+            trends[f"{name}_y"] = fitted[rows, i]
+            trends[f"{name}_lo"] = bounds[0, rows, i]
+            trends[f"{name}_hi"] = bounds[1, rows, i]
+
+        return trends
+
+
 #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 # Main ----
 #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -22,10 +22,21 @@ print("\n1.1. Libraries and Initialization")
 
 # Import necessary libraries
 import os
+import re
 import datetime
 import json
 import pickle
+from pathlib import Path
+from types import MappingProxyType
+import numpy as np
 import pandas as pd
+import matplotlib
+
+# Use the non-interactive Agg backend in batch runs (figures are only saved, not shown)
+BATCH_MODE = bool(os.environ.get("OCTRAFFIC_BATCH"))
+if BATCH_MODE:
+    matplotlib.use("Agg")
+
 import matplotlib.pyplot as plt
 from dotenv import load_dotenv
 
@@ -41,6 +52,9 @@ plt.rcParams["font.serif"] = ["Times New Roman"]
 # Load environment variables from .env file
 load_dotenv()
 
+# Verbose flag (set OCTRAFFIC_VERBOSE=1): when True, the table data frames, test results and LaTeX tables are also printed to the console
+VERBOSE = os.environ.get("OCTRAFFIC_VERBOSE", "0") == "1"
+
 os.getcwd()
 
 
@@ -52,6 +66,9 @@ print("\n1.2. Project and Workspace Variables")
 # Create a dictionary with the project metadata
 print("\nCreating project metadata")
 prj_meta = octr.prj_meta
+# Format the project start and end dates once (used in the table footnotes)
+date_start_str = prj_meta["date_start"].strftime("%m/%d/%Y")
+date_end_str = prj_meta["date_end"].strftime("%m/%d/%Y")
 
 # Create a dictionary with the project directories
 print("\nCreating project directories")
@@ -64,8 +81,8 @@ print(f"\nCurrent working directory: {os.getcwd()}\n")
 
 # Import the LaTeX variables dictionary from the json file on disk
 latex_vars_path = os.path.join(prj_dirs["metadata"], "latex_vars.json")
-with open(latex_vars_path, encoding = "utf-8") as json_file:
-    latex_vars = json.load(json_file)
+with open(latex_vars_path, "rb") as json_file:
+    latex_vars = json.loads(json_file.read())
 
 
 #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -144,6 +161,175 @@ print("- Creating a data frame from the codebook")
 df_cb = octr.df_cb
 
 
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+## 1.5. Table Definitions ----
+#~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+print("\n1.5. Table Definitions")
+
+# Dictionary for column labels, orders, and groups (a midrule separates each group in the table)
+TBL3_LABELS = MappingProxyType(
+    {
+        "crash_tag": {"label": "Crashes", "var_order": 1, "group": 1},
+        "party_tag": {"label": "Parties", "var_order": 2, "group": 1},
+        "victim_tag": {"label": "Victims", "var_order": 3, "group": 1},
+        "ind_fatal": {"label": "Fatal Injuries", "var_order": 4, "group": 1},
+        "ind_severe": {"label": "Severe Injuries", "var_order": 5, "group": 1},
+        "ind_multi": {"label": "Multiple Victim Injuries", "var_order": 6, "group": 1},
+        "ped_accident": {"label": "Pedestrian Accidents", "var_order": 7, "group": 2},
+        "bic_accident": {"label": "Bicycle Accidents", "var_order": 8, "group": 2},
+        "mc_accident": {"label": "Motorcycle Accidents", "var_order": 9, "group": 2},
+        "truck_accident": {"label": "Truck Accidents", "var_order": 10, "group": 2},
+        "number_killed": {"label": "Killed Victims", "var_order": 11, "group": 3},
+        "number_inj": {"label": "Injured Victims", "var_order": 12, "group": 3},
+        "count_fatal_severe": {"label": "Fatal or Severe Injuries", "var_order": 13, "group": 3},
+        "count_minor_pain": {"label": "Minor or Pain Injuries", "var_order": 14, "group": 3},
+        "count_severe_inj": {"label": "Severe Injuries", "var_order": 15, "group": 3},
+        "count_visible_inj": {"label": "Visible Injuries", "var_order": 16, "group": 3},
+        "count_complaint_pain": {"label": "Complaint of Pain Injuries", "var_order": 17, "group": 3},
+        "count_car_killed": {"label": "Killed Car Victims", "var_order": 18, "group": 4},
+        "count_ped_killed": {"label": "Killed Pedestrians", "var_order": 19, "group": 4},
+        "count_bic_killed": {"label": "Killed Bicycles", "var_order": 20, "group": 4},
+        "count_mc_killed": {"label": "Killed Motorcyclists", "var_order": 21, "group": 4},
+        "count_car_inj": {"label": "Injured Car Victims", "var_order": 22, "group": 4},
+        "count_ped_inj": {"label": "Injured Pedestrians", "var_order": 23, "group": 4},
+        "count_bic_inj": {"label": "Injured Bicycles", "var_order": 24, "group": 4},
+        "count_mc_inj": {"label": "Injured Motorcyclists", "var_order": 25, "group": 4},
+        "at_fault": {"label": "At Fault", "var_order": 26, "group": 5},
+        "hit_and_run_bin": {"label": "Hit and Run", "var_order": 27, "group": 5},
+        "alcohol_involved": {"label": "Alcohol Involved", "var_order": 28, "group": 5},
+        "dui_alcohol_ind": {"label": "DUI Alcohol", "var_order": 29, "group": 5},
+        "dui_drug_ind": {"label": "DUI Drugs", "var_order": 30, "group": 5},
+        "rush_hours_bin": {"label": "Rush Hours", "var_order": 31, "group": 6},
+        "intersection": {"label": "Intersection", "var_order": 32, "group": 6},
+        "state_hwy_ind": {"label": "State Highway", "var_order": 33, "group": 6},
+        "tow_away": {"label": "Tow Away", "var_order": 34, "group": 6},
+    }
+)
+
+# Table 3 columns to keep (in order) and their display names
+TBL3_COLS = ("stat.type", "order", "group", "label", "sum", "min", "max", "mean", "std.dev", "SE.mean", "CI.mean.0.95")
+TBL3_RENAME = MappingProxyType(
+    {
+        "label": "Factor (Count or Bin)",
+        "sum": "Total",
+        "min": "Min",
+        "max": "Max",
+        "mean": "Mean",
+        "std.dev": "SD",
+        "SE.mean": "SE",
+        "CI.mean.0.95": "CI",
+    }
+)
+
+# Lookup series for the Table 3 labels, orders, and groups (indexed by var.name)
+tbl3_label_series = pd.Series({key: value["label"] for key, value in TBL3_LABELS.items()})
+tbl3_order_series = pd.Series({key: value["var_order"] for key, value in TBL3_LABELS.items()}, dtype = "int16")
+tbl3_group_series = pd.Series({key: value["group"] for key, value in TBL3_LABELS.items()}, dtype = "int16")
+tbl3_label_keys = frozenset(TBL3_LABELS)
+
+# Dictionary for column labels, orders, and groups (a midrule separates each group in the table)
+TBL4_LABELS = MappingProxyType(
+    {
+        "party_number": {"label": "Parties", "var_order": 1, "group": 1},
+        "victim_number": {"label": "Victims", "var_order": 2, "group": 1},
+        "party_number_killed": {"label": "Killed Parties", "var_order": 3, "group": 1},
+        "party_number_inj": {"label": "Injured Parties", "var_order": 4, "group": 1},
+        "victim_degree_of_injury": {"label": "Victim Degree of Injury", "var_order": 5, "group": 1},
+        "coll_severity_num": {"label": "Severity", "var_order": 6, "group": 2},
+        "party_age": {"label": "Median Party Age", "var_order": 7, "group": 2},
+        "victim_age": {"label": "Median Victim Age", "var_order": 8, "group": 2},
+        "hit_and_run": {"label": "Hit and Run", "var_order": 9, "group": 2},
+        "distance": {"label": "Distance", "var_order": 10, "group": 2},
+        "lighting": {"label": "Lighting", "var_order": 11, "group": 2},
+        "vehicle_year_group": {"label": "Vehicle Year Group", "var_order": 12, "group": 2},
+        "city_area_sq_mi": {"label": "City Area (sq. mi)", "var_order": 13, "group": 3},
+        "city_pop_total": {"label": "City Population", "var_order": 14, "group": 3},
+        "city_hou_total": {"label": "City Housing Units", "var_order": 15, "group": 3},
+        "city_pop_dens": {"label": "City Population Density", "var_order": 16, "group": 3},
+        "city_hou_dens": {"label": "City Housing Density", "var_order": 17, "group": 3},
+        "city_pop_asian": {"label": "City Asian Population", "var_order": 18, "group": 3},
+        "city_pop_black": {"label": "City Black Population", "var_order": 19, "group": 3},
+        "city_pop_hispanic": {"label": "City Hispanic Population", "var_order": 20, "group": 3},
+        "city_pop_white": {"label": "City White Population", "var_order": 21, "group": 3},
+        "city_vehicles": {"label": "City Vehicles", "var_order": 22, "group": 3},
+        "city_mean_travel_time": {"label": "City Mean Travel Time", "var_order": 23, "group": 3},
+        "roads_primary": {"label": "City Primary Roads", "var_order": 24, "group": 4},
+        "roads_secondary": {"label": "City Secondary Roads", "var_order": 25, "group": 4},
+        "roads_local": {"label": "City Local Roads", "var_order": 26, "group": 4},
+        "road_length_mean": {"label": "City Mean Road Length", "var_order": 27, "group": 4},
+        "road_length_sum": {"label": "City Total Road Length", "var_order": 38, "group": 4},
+    }
+)
+
+# Table 4 columns to keep (in order) and their display names
+TBL4_COLS = ("label", "mean", "min", "max", "std.dev", "median")
+TBL4_RENAME = MappingProxyType(
+    {
+        "label": "Factor (Count or Bin)",
+        "mean": "Mean",
+        "min": "Min",
+        "max": "Max",
+        "std.dev": "SD",
+        "median": "Median",
+    }
+)
+
+# Lookup series for the Table 4 labels, orders, and groups (indexed by var.name)
+tbl4_label_series = pd.Series({key: value["label"] for key, value in TBL4_LABELS.items()})
+tbl4_order_series = pd.Series({key: value["var_order"] for key, value in TBL4_LABELS.items()}, dtype = "int16")
+tbl4_group_series = pd.Series({key: value["group"] for key, value in TBL4_LABELS.items()}, dtype = "int16")
+
+# Selected ts_year columns for Table 5 and their display names
+TBL5_COLS = (
+    "crash_tag_sum",
+    "party_tag_sum",
+    "victim_tag_sum",
+    "number_killed_sum",
+    "number_inj_sum",
+    "count_severe_inj_sum",
+    "count_visible_inj_sum",
+    "count_complaint_pain_sum",
+    "count_car_killed_sum",
+    "count_car_inj_sum",
+    "count_ped_killed_sum",
+    "count_ped_inj_sum",
+    "count_bic_killed_sum",
+    "count_bic_inj_sum",
+    "count_mc_killed_sum",
+    "count_mc_inj_sum",
+)
+TBL5_NAMES = (
+    "Crashes",
+    "Parties",
+    "Victims",
+    "Fatal",
+    "Injuries Total",
+    "Injuries Severe",
+    "Injuries Visible",
+    "Injuries Pain",
+    "Cars Killed",
+    "Cars Injured",
+    "Pedestrians Killed",
+    "Pedestrians Injured",
+    "Bicyclists Killed",
+    "Bicyclists Injured",
+    "Motorcyclists Killed",
+    "Motorcyclists Injured",
+)
+
+# Table 5 tabular opening and two-level header (grouped injury and victim type columns)
+TBL5_HEADER = "\n".join(
+    [
+        "\\begin{tabular}{crrrrrrrrrrrrrrrr}",
+        "\\toprule",
+        "\\multirow[c]{2}{*}{Year} & \\multicolumn{1}{c}{\\multirow{2}{*}{Crashes}} & \\multicolumn{1}{c}{\\multirow{2}{*}{Parties}} & \\multicolumn{1}{c}{\\multirow{2}{*}{Victims}} & \\multicolumn{1}{c}{\\multirow{2}{*}{Fatal}} & \\multicolumn{4}{c}{Injuries} & \\multicolumn{2}{c}{Cars} & \\multicolumn{2}{c}{Pedestrians} & \\multicolumn{2}{c}{Bicyclists} & \\multicolumn{2}{c}{Motorcyclists} \\\\",
+        "\\cmidrule{6-9}\\cmidrule{10-11}\\cmidrule{12-13}\\cmidrule{14-15}\\cmidrule{16-17}",
+        "&  &  &  &  & {Total} & {Severe} & {Visible} & {Pain} & {Killed} & {Injured} & {Killed} & {Injured} & {Killed} & {Injured} & {Killed} & {Injured} \\\\",
+        "\\midrule",
+    ]
+)
+
+
 #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 # 2. Data Analysis ----
 #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -341,13 +527,18 @@ overall_stats = {
 }
 x3 = pd.concat([x3, pd.DataFrame([overall_stats])], ignore_index = True)
 
-# Remove the overall stats dictionary
-del overall_stats
+# Locate the fatal injury row in each summary table
+fatal_idx = {name: x.index[x["severity"] == "Fatal injury"][0] for name, x in {"x1": x1, "x2": x2, "x3": x3}.items()}
 
-# Add the fatality counts for crashes, parties, and victims to the latex_vars dictionary
-latex_vars["crashesFatalities"] = int(x1.loc[x1["severity"] == "Fatal injury", "count"].values[0])
-latex_vars["partiesFatalities"] = int(x2.loc[x2["severity"] == "Fatal injury", "count"].values[0])
-latex_vars["victimsFatalities"] = int(x3.loc[x3["severity"] == "Fatal injury", "count"].values[0])
+# Get the fatality counts for crashes, parties, and victims
+tbl1_fatalities = {
+    "crashesFatalities": int(x1.at[fatal_idx["x1"], "count"]),
+    "partiesFatalities": int(x2.at[fatal_idx["x2"], "count"]),
+    "victimsFatalities": int(x3.at[fatal_idx["x3"], "count"]),
+}
+# Check if the fatality counts differ from the ones on disk, and add them to the latex_vars dictionary
+latex_vars_updated = any(latex_vars.get(key) != value for key, value in tbl1_fatalities.items())
+latex_vars.update(tbl1_fatalities)
 
 
 ### Conduct Non-Parametric Rank Tests ----
@@ -355,13 +546,14 @@ latex_vars["victimsFatalities"] = int(x3.loc[x3["severity"] == "Fatal injury", "
 print("\n- Conduct Non-Parametric Rank Tests")
 
 # Perform the chi-squared and Kruskal-Wallis tests for the crashes, parties, and victims by severity variable. Specifically, the chi-squared goodness of fit test for the crashes variable counts, the chi-squared test for the parties and victims variable counts (by party_count and victim_count respectively), and the Kruskal-Wallis test for the parties and victims variable counts (by party_count and victim_count respectively).
-# Perform the chi-squared test for the crashes, parties and victims variables
+# Perform the chi-squared goodness of fit test for the crashes variable
 crashes_chi2 = octr.chi2_gof_test(df1, "severity")
-parties_chi2 = octr.chi2_test(df2, "party_count", "severity")
-victims_chi2 = octr.chi2_test(df3, "victim_count", "severity")
-# Perform the Kruskal-Wallis test for the parties and victims variable counts
-parties_kw = octr.kruskal_test(df2, "party_count", "severity")
-victims_kw = octr.kruskal_test(df3, "victim_count", "severity")
+# Perform the chi-squared and Kruskal-Wallis tests for the parties and victims variable counts (one grouping pass per dataset)
+parties_chi2, parties_kw = octr.grouped_rank_tests(df2, "party_count", "severity")
+victims_chi2, victims_kw = octr.grouped_rank_tests(df3, "victim_count", "severity")
+
+# Release the per-record severity data frames (only the x1, x2, x3 summaries are used from here on)
+del df1, df2, df3
 
 tbl1_tests = pd.DataFrame(
     {
@@ -403,7 +595,9 @@ tbl1_tests = pd.DataFrame(
         ],
     }
 )
-print(tbl1_tests)
+# Print the test results only in verbose runs
+if VERBOSE:
+    print(tbl1_tests)
 
 
 ### Create Table 1 ----
@@ -411,36 +605,37 @@ print(tbl1_tests)
 print("\n- Create Table 1")
 
 # Create a summary table of the crashes, parties, and victims by severity
+# (counts and means are formatted with a bound str.format, ranges with vectorized string concatenation)
 tbl1_data = pd.DataFrame(
     {
         "severity": pd.concat([x1["severity"], pd.Series(["p-value"])], ignore_index = True),
         "crashes": pd.concat(
-            [x1["count"].apply(lambda x: f"{x:,}"), pd.Series([crashes_chi2["p-value_display"]])],
+            [x1["count"].map("{:,}".format), pd.Series([crashes_chi2["p-value_display"]])],
             ignore_index = True,
         ),
         "parties": pd.concat(
-            [x2["count"].apply(lambda x: f"{x:,}"), pd.Series([crashes_chi2["p-value_display"]])],
+            [x2["count"].map("{:,}".format), pd.Series([crashes_chi2["p-value_display"]])],
             ignore_index = True,
         ),
         "victims": pd.concat(
-            [x3["count"].apply(lambda x: f"{x:,}"), pd.Series([crashes_chi2["p-value_display"]])],
+            [x3["count"].map("{:,}".format), pd.Series([crashes_chi2["p-value_display"]])],
             ignore_index = True,
         ),
         "party_mean": pd.concat(
-            [x2["mean"].apply(lambda x: f"{x:,.3f}"), pd.Series([parties_kw["p-value_display"]])],
+            [x2["mean"].map("{:,.3f}".format), pd.Series([parties_kw["p-value_display"]])],
             ignore_index = True,
         ),
-        "party_std": pd.concat([x2["std"].apply(lambda x: f"{x:,.3f}"), pd.Series([""])], ignore_index = True),
+        "party_std": pd.concat([x2["std"].map("{:,.3f}".format), pd.Series([""])], ignore_index = True),
         "party_range": pd.concat(
-            [x2.apply(lambda row: f"{row['min']}-{row['max']}", axis = 1), pd.Series([""])], ignore_index = True
+            [x2["min"].astype(str) + "-" + x2["max"].astype(str), pd.Series([""])], ignore_index = True
         ),
         "victim_mean": pd.concat(
-            [x3["mean"].apply(lambda x: f"{x:,.3f}"), pd.Series([victims_kw["p-value_display"]])],
+            [x3["mean"].map("{:,.3f}".format), pd.Series([victims_kw["p-value_display"]])],
             ignore_index = True,
         ),
-        "victim_std": pd.concat([x3["std"].apply(lambda x: f"{x:,.3f}"), pd.Series([""])], ignore_index = True),
+        "victim_std": pd.concat([x3["std"].map("{:,.3f}".format), pd.Series([""])], ignore_index = True),
         "victim_range": pd.concat(
-            [x3.apply(lambda row: f"{row['min']}-{row['max']}", axis = 1), pd.Series([""])], ignore_index = True
+            [x3["min"].astype(str) + "-" + x3["max"].astype(str), pd.Series([""])], ignore_index = True
         ),
     }
 )
@@ -461,96 +656,52 @@ multi_columns = [
 # Assign the multi-index columns to the data frame
 tbl1_data.columns = pd.MultiIndex.from_tuples(multi_columns)
 
-# get the last row of tbl1_data
-last_row = tbl1_data.iloc[-1].copy()
-# Change the last row values
-last_row.iloc[1] = f"{last_row.iloc[1]}\\footnotemark[2]"
-last_row.iloc[2] = f"{last_row.iloc[2]}\\footnotemark[2]"
-last_row.iloc[3] = f"{last_row.iloc[3]}\\footnotemark[2]"
-last_row.iloc[4] = f"{last_row.iloc[4]}\\footnotemark[3]"
-last_row.iloc[7] = f"{last_row.iloc[7]}\\footnotemark[3]"
-
-# Create a modified table with the last row changed
-tbl1_mod = tbl1_data.copy()
-tbl1_mod.iloc[-1] = last_row
-
-# Create the LaTeX table from the data frame
-tbl1_latex = tbl1_mod.to_latex(
-    buf = None,
-    columns = None,
-    header = True,
-    index = False,
-    na_rep = "NaN",
-    formatters = None,
-    float_format = None,
-    sparsify = None,
-    index_names = True,
-    bold_rows = False,
-    column_format = "lrrrrrcrrc",
-    longtable = False,
-    escape = False,
-    encoding = None,
-    decimal = ".",
-    multicolumn = True,
-    multicolumn_format = "c",
-    multirow = True,
-    caption = graphics_list["tables"]["tbl1"]["caption"],
-    label = graphics_list["tables"]["tbl1"]["id"].lower(),
-    position = None,
+# Define the LaTeX row template for the ten table columns
+tbl1_row_tmpl = " & ".join(["{}"] * 10) + " \\\\"
+
+# Define the footnote marks for the p-value row (chi-squared for the counts, Kruskal-Wallis for the means)
+tbl1_pvalue_marks = ["", "\\footnotemark[2]", "\\footnotemark[2]", "\\footnotemark[2]", "\\footnotemark[3]", "", "", "\\footnotemark[3]", "", ""]
+
+# Render the severity level rows, the overall row, and the p-value row (escaping the '<' in the p-value display)
+tbl1_rows = [tbl1_row_tmpl.format(*row) for row in tbl1_data.iloc[:-1].itertuples(index = False, name = None)]
+tbl1_pvalue_row = tbl1_row_tmpl.format(
+    *(f"{value}{mark}".replace("<", "\\textless{}") for value, mark in zip(tbl1_data.iloc[-1], tbl1_pvalue_marks))
 )
 
-# Add option [h!] to the table
-tbl1_latex = tbl1_latex.replace("\\begin{table}", "\\begin{table}[h!]")
-# Escape special characters
-tbl1_latex = tbl1_latex.replace("<", "\\textless{}")
-# Make subheading text italic
-tbl1_latex = tbl1_latex.replace("mean", "\\textit{mean}")
-tbl1_latex = tbl1_latex.replace("std", "\\textit{std}")
-tbl1_latex = tbl1_latex.replace("range", "\\textit{range}")
-tbl1_latex = tbl1_latex.replace("Party Count", "Party Count\\footnotemark[1]")
-tbl1_latex = tbl1_latex.replace("Victim Count", "Victim Count\\footnotemark[1]")
-
-# Split the LaTeX table into lines for easier manipulation
-tbl1_latex_lines = tbl1_latex.splitlines()
-
-# Find the line to insert the midrule
-midrule_idx = None
-for i, line in enumerate(tbl1_latex_lines):
-    # If line begins with "9":
-    if line.startswith("Overall"):
-        midrule_idx = i
-        break
-# Add the midrule
-if midrule_idx is not None:
-    tbl1_latex_lines.insert(midrule_idx, r"\midrule")
-    del midrule_idx
-
-# Join the lines back together
-tbl1_latex = "\n".join(tbl1_latex_lines)
-# Delete the temporary latex lines
-del tbl1_latex_lines
-
-# Add footnotes after the table
-footnotes = (
-    "\\footnotetext[1]{Per each collision: \\textit{mean, sd, range(min, max)}}\n"
-    "\\footnotetext[2]{Pearson's Chi-Squared test}\n"
-    "\\footnotetext[3]{Kruskal-Wallis rank sum test}"
+# Assemble the LaTeX table: [h!] placement, italic subheadings, footnote marks, a midrule before the overall row, and the footnotes after the tabular
+tbl1_latex = "\n".join(
+    [
+        "\\begin{table}[h!]",
+        f"\\caption{{{graphics_list['tables']['tbl1']['caption']}}}",
+        f"\\label{{{graphics_list['tables']['tbl1']['id'].lower()}}}",
+        "\\begin{tabular}{lrrrrrcrrc}",
+        "\\toprule",
+        "\\multicolumn{4}{c}{} & \\multicolumn{3}{c}{Party Count\\footnotemark[1]} & \\multicolumn{3}{c}{Victim Count\\footnotemark[1]} \\\\",
+        "Severity Level & Crashes & Parties & Victims & \\textit{mean} & \\textit{std} & \\textit{range} & \\textit{mean} & \\textit{std} & \\textit{range} \\\\",
+        "\\midrule",
+        *tbl1_rows[:-1],
+        "\\midrule",
+        tbl1_rows[-1],
+        tbl1_pvalue_row,
+        "\\bottomrule",
+        "\\end{tabular}",
+        "\\footnotetext[1]{Per each collision: \\textit{mean, sd, range(min, max)}}",
+        "\\footnotetext[2]{Pearson's Chi-Squared test}",
+        "\\footnotetext[3]{Kruskal-Wallis rank sum test}",
+        "\\end{table}",
+        "",
+    ]
 )
-if "\\end{tabular}" in tbl1_latex:
-    tbl1_latex = tbl1_latex.replace("\\end{tabular}", "\\end{tabular}\n" + footnotes)
-elif "\\end{longtable}" in tbl1_latex:
-    tbl1_latex = tbl1_latex.replace("\\end{longtable}", "\\end{longtable}\n" + footnotes)
-else:
-    tbl1_latex += "\n" + footnotes
 
-print(tbl1_latex)
+# Print the LaTeX table only in verbose runs
+if VERBOSE:
+    print(tbl1_latex)
 
 # Define the path to save the LaTeX table
 tbl1_path = graphics_list["tables"]["tbl1"]["path"]
 # Save the LaTeX table to a file
-with open(tbl1_path, "w", encoding = "utf-8") as f:
-    f.write(tbl1_latex)
-    print(f"\n- Table 1 saved to {tbl1_path}")
+Path(tbl1_path).write_text(tbl1_latex, encoding = "utf-8")
+print(f"\n- Table 1 saved to {tbl1_path}")
 
 
 ### Save the Graphics Dataset ----
@@ -562,21 +713,23 @@ tbl1_dataset = {"raw": {"x1": x1, "x2": x2, "x3": x3}, "data": tbl1_data, "tests
 
 # Save the graphics dataset to disk
 tbl1_dataset_path = os.path.join(prj_dirs["data_python"], graphics_list["tables"]["tbl1"]["file"] + ".pkl")
-with open(tbl1_dataset_path, "wb") as f:
-    pickle.dump(tbl1_dataset, f)
+with open(tbl1_dataset_path, "wb", buffering = 1 << 20) as f:
+    pickle.dump(tbl1_dataset, f, protocol = 5)
     print(f"\n- Graphics dataset saved to {tbl1_dataset_path}")
 
-# Save the updated latex_vars dictionary to the json file on disk replacing the old one
+# Save the updated latex_vars dictionary to the json file on disk replacing the old one (only if the fatality counts changed)
 latex_vars_path = os.path.join(prj_dirs["metadata"], "latex_vars.json")
-with open(latex_vars_path, "w", encoding = "utf-8") as json_file:
-    json.dump(latex_vars, json_file, indent = 4)
-    print(f"\n- Updated LaTeX variables saved to {latex_vars_path}")
+if latex_vars_updated:
+    with open(latex_vars_path, "w", encoding = "utf-8") as json_file:
+        json.dump(latex_vars, json_file, indent = 4)
+        print(f"\n- Updated LaTeX variables saved to {latex_vars_path}")
+else:
+    print(f"\n- LaTeX variables unchanged in {latex_vars_path}")
 
 # Save the LaTeX variables dictionary to a .tex file
 latex_vars_tex_path = os.path.join(prj_dirs["graphics"], "latex_vars.tex")
 with open(latex_vars_tex_path, "w", encoding = "utf-8") as f:
-    for key, value in latex_vars.items():
-        f.write(f"\\newcommand{{\\{key}}}{{{value}}}\n")
+    f.writelines([f"\\newcommand{{\\{key}}}{{{value}}}\n" for key, value in latex_vars.items()])
 
 
 #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -694,7 +847,9 @@ for i in range(len(tbl2_data)):
 # Relocate the Fatalities, Injuries, and Type columns after the Level column
 octr.relocate_column(df = tbl2_data, col_name = ["Fatalities", "Injuries", "Type"], ref_col_name = "Level", position = "after")
 
-print(tbl2_data)
+# Print the data frame only in verbose runs
+if VERBOSE:
+    print(tbl2_data)
 
 
 ### Conduct Non-Parametric Rank Tests ----
@@ -726,7 +881,9 @@ tbl2_tests = pd.DataFrame(
     }
 )
 
-print(tbl2_tests)
+# Print the test results only in verbose runs
+if VERBOSE:
+    print(tbl2_tests)
 
 
 ### Create Table 2 ----
@@ -754,89 +911,40 @@ tbl2_mod.loc[len(tbl2_mod)] = last_row
 # In the rank column replace the value 10 with empty string
 tbl2_mod["Rank"] = tbl2_mod["Rank"].replace(9, "")
 
-# Create the LaTeX table from the data frame
-tbl2_latex = tbl2_mod.to_latex(
-    buf = None,
-    columns = None,
-    header = True,
-    index = False,
-    na_rep = "NaN",
-    formatters = None,
-    float_format = None,
-    sparsify = None,
-    index_names = True,
-    bold_rows = False,
-    column_format = "crrrrrrr",
-    longtable = False,
-    escape = False,
-    encoding = None,
-    decimal = ".",
-    multicolumn = True,
-    multicolumn_format = "c",
-    multirow = True,
-    caption = graphics_list["tables"]["tbl2"]["caption"],
-    label = graphics_list["tables"]["tbl2"]["id"].lower(),
-    position = None,
-)
+# Define the LaTeX row template for the eight table columns
+tbl2_row_tmpl = " & ".join(["{}"] * 8) + " \\\\"
+# Render the table rows
+tbl2_rows = [tbl2_row_tmpl.format(*row) for row in tbl2_mod.itertuples(index = False, name = None)]
 
-# Add option [h!] to the table
-tbl2_latex = tbl2_latex.replace("\\begin{table}", "\\begin{table}[h!]")
-
-# Split the LaTeX table into lines for easier manipulation
-tbl2_latex_lines = tbl2_latex.splitlines()
-
-# Merge columns 1 and 2 under the heading 'Rank and Level'
-# Find the header row (usually after \toprule)
-header_idx = None
-midrule_idx = None
-for i, line in enumerate(tbl2_latex_lines):
-    if "\\toprule" in line:
-        header_idx = i + 1
-        break
-# Extract the header line and break it into parts
-if header_idx is not None:
-    header_line = tbl2_latex_lines[header_idx]
-    header_parts = header_line.split(" & ")
-    # Replace columns 1 and 2 with a merged heading
-    header_parts[0] = "\\multicolumn{2}{c}{Rank and Level}"
-    del header_parts[1]  # Remove the next column header
-    # Reconstruct the header line
-    tbl2_latex_lines[header_idx] = " & ".join(header_parts)
-
-# Find the line to insert the midrule
-for i, line in enumerate(tbl2_latex_lines):
-    # If line begins with "8":
-    if line.startswith("8"):
-        midrule_idx = i + 1
-        break
-# Add the midrule
-if midrule_idx is not None:
-    tbl2_latex_lines.insert(midrule_idx, r"\midrule")
-    # Delete the midrule index variable
-del midrule_idx
-
-# Join the lines back together
-tbl2_latex = "\n".join(tbl2_latex_lines)
-# Delete the temporary latex lines
-del tbl2_latex_lines
-
-# Add footnotes after the table
-footnotes = "\\footnotetext[1]{Pearson's Chi-Squared test}"
-if "\\end{tabular}" in tbl2_latex:
-    tbl2_latex = tbl2_latex.replace("\\end{tabular}", "\\end{tabular}\n" + footnotes)
-elif "\\end{longtable}" in tbl2_latex:
-    tbl2_latex = tbl2_latex.replace("\\end{longtable}", "\\end{longtable}\n" + footnotes)
-else:
-    tbl2_latex += "\n" + footnotes
+# Assemble the LaTeX table in a single pass: [h!] placement, columns 1 and 2 merged under the heading 'Rank and Level', a midrule before the total and p-value rows, and the footnotes after the tabular
+tbl2_latex = "\n".join(
+    [
+        "\\begin{table}[h!]",
+        f"\\caption{{{graphics_list['tables']['tbl2']['caption']}}}",
+        f"\\label{{{graphics_list['tables']['tbl2']['id'].lower()}}}",
+        "\\begin{tabular}{crrrrrrr}",
+        "\\toprule",
+        "\\multicolumn{2}{c}{Rank and Level} & Fatalities & Injuries & Type & Crashes & Parties & Victims \\\\",
+        "\\midrule",
+        *tbl2_rows[:-2],
+        "\\midrule",
+        *tbl2_rows[-2:],
+        "\\bottomrule",
+        "\\end{tabular}",
+        "\\footnotetext[1]{Pearson's Chi-Squared test}",
+        "\\end{table}",
+    ]
+)
 
-print(tbl2_latex)
+# Print the LaTeX table only in verbose runs
+if VERBOSE:
+    print(tbl2_latex)
 
 # Define the path to save the LaTeX table
 tbl2_path = graphics_list["tables"]["tbl2"]["path"]
 # Save the LaTeX table to a file
-with open(tbl2_path, "w", encoding = "utf-8") as f:
-    f.write(tbl2_latex)
-    print(f"\n- Table 2 saved to {tbl2_path}")
+Path(tbl2_path).write_text(tbl2_latex, encoding = "utf-8")
+print(f"\n- Table 2 saved to {tbl2_path}")
 
 
 ### Save the Graphics Dataset ----
@@ -849,8 +957,8 @@ tbl2_dataset = {"raw": tbl2_raw, "data": tbl2_data, "tests": tbl2_tests, "latex"
 
 # Save the graphics dataset to disk
 tbl2_dataset_path = os.path.join(prj_dirs["data_python"], graphics_list["tables"]["tbl2"]["file"] + ".pkl")
-with open(tbl2_dataset_path, "wb") as f:
-    pickle.dump(tbl2_dataset, f)
+with open(tbl2_dataset_path, "wb", buffering = 1 << 20) as f:
+    pickle.dump(tbl2_dataset, f, protocol = 5)
     print(f"\n- Graphics dataset saved to {tbl2_dataset_path}")
 
 
@@ -891,17 +999,16 @@ print("\n- Create the Histogram Plot")
 # Run the function and get the figure and axes objects
 fig1, ax1 = plt.subplots(figsize = (12, 8))
 fig1, ax1 = octr.plot_victim_count_histogram(crashes, fig = fig1, ax = ax1)
-fig1.show()
-plt.close(fig1)
+# Show the figure only in interactive runs (skips an extra renderer pass in batch mode)
+if not BATCH_MODE:
+    fig1.show()
 
 
 ### Save the Figure ----
 #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 print("\n- Save the Figure")
 
-# Save the figure to a file
-fig1, ax1 = plt.subplots(figsize = (12, 8))
-fig1, ax1 = octr.plot_victim_count_histogram(crashes, fig = fig1, ax = ax1)
+# Save the already rendered figure to a file
 fig1.savefig(
     fname = graphics_list["graphics"]["fig1"]["path"],
     transparent = True,
@@ -953,17 +1060,16 @@ print("\n- Create the Bar Chart Plot")
 # Run the function to create the bar chart
 fig2, ax2 = plt.subplots(figsize = (12, 8))
 fig2, ax2 = octr.plot_collision_type_bar(crashes, fig = fig2, ax = ax2)
-fig2.show()
-plt.close(fig2)
+# Show the figure only in interactive runs (skips an extra renderer pass in batch mode)
+if not BATCH_MODE:
+    fig2.show()
 
 
 ### Save the Figure ----
 #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 print("\n- Save the Figure")
 
-# Save the figure to a file
-fig2, ax2 = plt.subplots(figsize = (12, 8))
-fig2, ax2 = octr.plot_collision_type_bar(crashes, fig = fig2, ax = ax2)
+# Save the already rendered figure to a file
 fig2.savefig(
     fname = graphics_list["graphics"]["fig2"]["path"],
     transparent = True,
@@ -1016,17 +1122,16 @@ print("\n- Create the Cumulative Bar Chart Plot")
 # Call the function to plot
 fig3, ax3 = plt.subplots(figsize = (12, 8))
 fig3, ax3 = octr.plot_fatalities_by_type_and_year(ts_year["crashes"], fig = fig3, ax = ax3)
-fig3.show()
-plt.close(fig3)
+# Show the figure only in interactive runs (skips an extra renderer pass in batch mode)
+if not BATCH_MODE:
+    fig3.show()
 
 
 ### Save the Figure ----
 #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 print("\n- Save the Figure")
 
-# Save the figure to a file
-fig3, ax3 = plt.subplots(figsize = (12, 8))
-fig3, ax3 = octr.plot_fatalities_by_type_and_year(ts_year["crashes"], fig = fig3, ax = ax3)
+# Save the already rendered figure to a file
 fig3.savefig(
     fname = graphics_list["graphics"]["fig3"]["path"],
     transparent = True,
@@ -1078,59 +1183,27 @@ print("\n- Construct Summary Table")
 
 # Applying the function to the collisions ts_month DataFrame (will be used in the next section)
 stats_month = octr.compute_monthly_stats(ts_month["collisions"])
+# Split the monthly stats by table once (sum for Table 3, mean and median for Table 4), keeping the original row order within each table
+stats_month_by_table = dict(
+    tuple(stats_month.groupby(stats_month["stat.type"].map({"sum": "tbl3", "mean": "tbl4", "median": "tbl4"}), sort = False))
+)
 
-# Dictionary for column labels and orders
-tbl3_labels = {
-    "crash_tag": {"label": "Crashes", "var_order": 1},
-    "party_tag": {"label": "Parties", "var_order": 2},
-    "victim_tag": {"label": "Victims", "var_order": 3},
-    "ind_fatal": {"label": "Fatal Injuries", "var_order": 4},
-    "ind_severe": {"label": "Severe Injuries", "var_order": 5},
-    "ind_multi": {"label": "Multiple Victim Injuries", "var_order": 6},
-    "ped_accident": {"label": "Pedestrian Accidents", "var_order": 7},
-    "bic_accident": {"label": "Bicycle Accidents", "var_order": 8},
-    "mc_accident": {"label": "Motorcycle Accidents", "var_order": 9},
-    "truck_accident": {"label": "Truck Accidents", "var_order": 10},
-    "number_killed": {"label": "Killed Victims", "var_order": 11},
-    "number_inj": {"label": "Injured Victims", "var_order": 12},
-    "count_fatal_severe": {"label": "Fatal or Severe Injuries", "var_order": 13},
-    "count_minor_pain": {"label": "Minor or Pain Injuries", "var_order": 14},
-    "count_severe_inj": {"label": "Severe Injuries", "var_order": 15},
-    "count_visible_inj": {"label": "Visible Injuries", "var_order": 16},
-    "count_complaint_pain": {"label": "Complaint of Pain Injuries", "var_order": 17},
-    "count_car_killed": {"label": "Killed Car Victims", "var_order": 18},
-    "count_ped_killed": {"label": "Killed Pedestrians", "var_order": 19},
-    "count_bic_killed": {"label": "Killed Bicycles", "var_order": 20},
-    "count_mc_killed": {"label": "Killed Motorcyclists", "var_order": 21},
-    "count_car_inj": {"label": "Injured Car Victims", "var_order": 22},
-    "count_ped_inj": {"label": "Injured Pedestrians", "var_order": 23},
-    "count_bic_inj": {"label": "Injured Bicycles", "var_order": 24},
-    "count_mc_inj": {"label": "Injured Motorcyclists", "var_order": 25},
-    "at_fault": {"label": "At Fault", "var_order": 26},
-    "hit_and_run_bin": {"label": "Hit and Run", "var_order": 27},
-    "alcohol_involved": {"label": "Alcohol Involved", "var_order": 28},
-    "dui_alcohol_ind": {"label": "DUI Alcohol", "var_order": 29},
-    "dui_drug_ind": {"label": "DUI Drugs", "var_order": 30},
-    "rush_hours_bin": {"label": "Rush Hours", "var_order": 31},
-    "intersection": {"label": "Intersection", "var_order": 32},
-    "state_hwy_ind": {"label": "State Highway", "var_order": 33},
-    "tow_away": {"label": "Tow Away", "var_order": 34},
-}
-
-# Filter rows where var.name ends with "sum"
-tbl3_data = stats_month[stats_month["var.name"].str.endswith("sum")].copy()
-# Remove the postfix "_sum" from var.name
-tbl3_data.loc[:, "var.name"] = tbl3_data["var.name"].str.replace("_sum$", "", regex = True)
-# Only keep rows where var.name is in tbl3_labels
-tbl3_data = tbl3_data[tbl3_data["var.name"].isin(tbl3_labels.keys())].copy()
+# Get the rows where stat.type is "sum" (var.name ends with "sum") and remove the postfix "_sum" from var.name (as a categorical)
+tbl3_var_names = stats_month_by_table["tbl3"]["var.name"].str.removesuffix("_sum").astype("category")
 
-# Add label and order columns based on tbl3_labels
-tbl3_data.loc[:, "label"] = tbl3_data["var.name"].map(lambda x: tbl3_labels[x]["label"])
-tbl3_data.loc[:, "order"] = tbl3_data["var.name"].map(lambda x: tbl3_labels[x]["var_order"])
+# Only keep rows where var.name is in TBL3_LABELS (filtered first, so every remaining name has an order and group)
+tbl3_mask = tbl3_var_names.isin(tbl3_label_keys)
+tbl3_var_names = tbl3_var_names[tbl3_mask]
 
-# Relocate the label and order columns
-octr.relocate_column(df = tbl3_data, col_name = "order", ref_col_name = "stat.type", position = "after")
-octr.relocate_column(df = tbl3_data, col_name = "label", ref_col_name = "order", position = "after")
+# Add label, order, and group columns based on TBL3_LABELS (builds a single new data frame)
+tbl3_data = stats_month_by_table["tbl3"].loc[tbl3_mask].assign(
+    **{
+        "var.name": tbl3_var_names,
+        "label": tbl3_var_names.map(tbl3_label_series),
+        "order": tbl3_var_names.map(tbl3_order_series).astype("int16"),
+        "group": tbl3_var_names.map(tbl3_group_series).astype("int16"),
+    }
+)
 
 # Remove the "var.name" column
 tbl3_data = tbl3_data.drop(columns = ["var.name"])
@@ -1139,134 +1212,78 @@ tbl3_data = tbl3_data.drop(columns = ["var.name"])
 tbl3_data = tbl3_data.sort_values("order")
 
 # Keep only the specified columns and reorder
-cols = ["stat.type", "order", "label", "sum", "min", "max", "mean", "std.dev", "SE.mean", "CI.mean.0.95"]
-tbl3_data = tbl3_data[[col for col in cols if col in tbl3_data.columns]]
-
-# Round integer columns (no decimal places)
-for col in ["sum", "min", "max"]:
-    if col in tbl3_data.columns:
-        tbl3_data.loc[:, col] = tbl3_data[col].astype("Int64").round(0)
-# Round float columns (2 decimal places)
-for col in ["mean", "std.dev", "SE.mean", "CI.mean.0.95"]:
-    if col in tbl3_data.columns:
-        tbl3_data.loc[:, col] = tbl3_data[col].astype(float).round(3)
+tbl3_data = tbl3_data[[col for col in TBL3_COLS if col in tbl3_data.columns]]
+
+# Round the integer columns (no decimal places) and the float columns (3 decimal places) in one call, then make the integer columns Int64
+tbl3_data = tbl3_data.round({"sum": 0, "min": 0, "max": 0, "mean": 3, "std.dev": 3, "SE.mean": 3, "CI.mean.0.95": 3}).astype(
+    {"sum": "Int64", "min": "Int64", "max": "Int64"}
+)
 
 # Sort by "order" and filter rows with order < 100
 tbl3_data = tbl3_data.sort_values("order")
 tbl3_data = tbl3_data[tbl3_data["order"] < 100]
 
-# Remove "stat.type" and "order" columns
-tbl3_data = tbl3_data.drop(columns = ["stat.type", "order"])
-
-# Rename columns
-col_rename = {
-    "label": "Factor (Count or Bin)",
-    "sum": "Total",
-    "min": "Min",
-    "max": "Max",
-    "mean": "Mean",
-    "std.dev": "SD",
-    "SE.mean": "SE",
-    "CI.mean.0.95": "CI",
-}
-tbl3_data = tbl3_data.rename(columns = col_rename)
-
-# Ensuring that Total, Min, and Max are always integers
-for col in ["Total", "Min", "Max"]:
-    if col in tbl3_data.columns:
-        tbl3_data[col] = tbl3_data[col].astype("Int64")
+# Get the row positions where the variable group changes (a midrule is added before each)
+tbl3_midrule_rows = set((np.flatnonzero(np.diff(tbl3_data["group"].to_numpy())) + 1).tolist())
 
-# Ensure that Mean, SD, SE, and CI are floats with 3 decimal places
-for col in ["Mean", "SD", "SE", "CI"]:
-    if col in tbl3_data.columns:
-        tbl3_data[col] = tbl3_data[col].astype(float).round(3)
+# Remove "stat.type", "order", and "group" columns
+tbl3_data = tbl3_data.drop(columns = ["stat.type", "order", "group"])
 
-# Format all numeric columns with a thousands comma separator if they have at least 4 digits
-for col in tbl3_data.columns:
-    if pd.api.types.is_numeric_dtype(tbl3_data[col]):
-        tbl3_data[col] = tbl3_data[col].apply(lambda x: f"{x:,}" if pd.notnull(x) and abs(x) >= 1000 else x)
+# Rename columns
+tbl3_data = tbl3_data.rename(columns = TBL3_RENAME)
 
-print(tbl3_data)
+# Print the data frame only in verbose runs
+if VERBOSE:
+    print(tbl3_data)
 
 
 ### Create Table 3 ----
 #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 print("\n- Create Table 3")
 
-tbl3_mod = tbl3_data.copy()
-# Convert all columns to string type
-tbl3_mod = tbl3_mod.astype(str)
-
-# Create the LaTeX table from the data frame
-tbl3_latex = tbl3_mod.to_latex(
-    buf = None,
-    columns = None,
-    header = True,
-    index = False,
-    na_rep = "NaN",
-    formatters = None,
-    float_format = None,
-    sparsify = None,
-    index_names = True,
-    bold_rows = False,
-    column_format = "lrrrrrrr",
-    longtable = False,
-    escape = False,
-    encoding = None,
-    decimal = ".",
-    multicolumn = True,
-    multicolumn_format = "c",
-    multirow = True,
-    caption = graphics_list["tables"]["tbl3"]["caption"],
-    label = graphics_list["tables"]["tbl3"]["id"].lower(),
-    position = None,
-)
+# Define the cell formatters: the factor labels as is, and the numeric columns with a thousands comma separator (applied while the rows are emitted)
+tbl3_formatters = [str] + ["{:,}".format] * (tbl3_data.shape[1] - 1)
 
-# Add option [h!] to the table
-tbl3_latex = tbl3_latex.replace("\\begin{table}", "\\begin{table}[h!]")
-
-# Split the LaTeX table into lines for easier manipulation
-tbl3_latex_lines = tbl3_latex.splitlines()
-
-# Replace line 5 with a custom header
+# Custom header line with the footnote marks
 header_line = r"Factor (Count or Bin) & Total\footnotemark[2] & Min\footnotemark[1] & Max\footnotemark[1] & Mean\footnotemark[1] & SD\footnotemark[1] & SE\footnotemark[1] & CI\footnotemark[1] \\"
-tbl3_latex_lines[5] = header_line
-
-midrule_idx = [13, 18, 26, 35, 41]
-for idx in midrule_idx:
-    # Insert a midrule after each specified index
-    tbl3_latex_lines.insert(idx, r"\midrule")
-
-# Join the lines back together
-tbl3_latex = "\n".join(tbl3_latex_lines)
-# Delete the temporary latex lines
-del tbl3_latex_lines
-
 
-# Add footnotes after the table
+# Footnotes to add after the table
 footnotes = (
     "\\footnotetext[1]{"
-    + f"Monthly generated cumulative summary time series from {prj_meta['date_start'].strftime('%m/%d/%Y')} through {prj_meta['date_end'].strftime('%m/%d/%Y')} (n = {len(ts_month['collisions'])})"
+    + f"Monthly generated cumulative summary time series from {date_start_str} through {date_end_str} (n = {len(ts_month['collisions'])})"
     + "}\n"
     "\\footnotetext[2]{"
     + f"Over the entire time period ({prj_meta['date_start'].year} - {prj_meta['date_end'].year})"
     + "}"
 )
-if "\\end{tabular}" in tbl3_latex:
-    tbl3_latex = tbl3_latex.replace("\\end{tabular}", "\\end{tabular}\n" + footnotes)
-elif "\\end{longtable}" in tbl3_latex:
-    tbl3_latex = tbl3_latex.replace("\\end{longtable}", "\\end{longtable}\n" + footnotes)
-else:
-    tbl3_latex += "\n" + footnotes
 
-print(tbl3_latex)
+# Assemble the LaTeX table in a single pass: [h!] placement, custom header, rows with the group midrules, and the footnotes after the tabular
+tbl3_latex_parts = [
+    "\\begin{table}[h!]",
+    f"\\caption{{{graphics_list['tables']['tbl3']['caption']}}}",
+    f"\\label{{{graphics_list['tables']['tbl3']['id'].lower()}}}",
+    "\\begin{tabular}{lrrrrrrr}",
+    "\\toprule",
+    header_line,
+    "\\midrule",
+]
+for i, row in enumerate(tbl3_data.itertuples(index = False, name = None)):
+    if i in tbl3_midrule_rows:
+        tbl3_latex_parts.append("\\midrule")
+    # Format the row cells (missing values are shown as NaN)
+    tbl3_latex_parts.append(" & ".join("NaN" if pd.isna(value) else fmt(value) for fmt, value in zip(tbl3_formatters, row)) + " \\\\")
+tbl3_latex_parts.extend(["\\bottomrule", "\\end{tabular}", footnotes, "\\end{table}"])
+tbl3_latex = "\n".join(tbl3_latex_parts)
+
+# Print the LaTeX table only in verbose runs
+if VERBOSE:
+    print(tbl3_latex)
 
 # Define the path to save the LaTeX table
 tbl3_path = graphics_list["tables"]["tbl3"]["path"]
 # Save the LaTeX table to a file
-with open(tbl3_path, "w", encoding = "utf-8") as f:
-    f.write(tbl3_latex)
-    print(f"\n- Table 3 saved to {tbl3_path}")
+Path(tbl3_path).write_text(tbl3_latex, encoding = "utf-8")
+print(f"\n- Table 3 saved to {tbl3_path}")
 
 
 ### Save the Graphics Dataset ----
@@ -1279,8 +1296,8 @@ tbl3_dataset = {"data": tbl3_data, "latex": tbl3_latex}
 
 # Save the graphics dataset to disk
 tbl3_dataset_path = os.path.join(prj_dirs["data_python"], graphics_list["tables"]["tbl3"]["file"] + ".pkl")
-with open(tbl3_dataset_path, "wb") as f:
-    pickle.dump(tbl3_dataset, f)
+with open(tbl3_dataset_path, "wb", buffering = 1 << 20) as f:
+    pickle.dump(tbl3_dataset, f, protocol = 5)
     print(f"\n- Graphics dataset saved to {tbl3_dataset_path}")
 
 
@@ -1318,178 +1335,99 @@ graphics_list = octr.graphics_entry(
 #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 print("\n- Construct Summary Table")
 
-# Filter stats_month to get rows where stat.type is 'mean' or 'median'
-tbl4_data = stats_month[stats_month["stat.type"].isin(["mean", "median"])].copy()
+# Get the stats_month rows where stat.type is 'mean' or 'median' (in their original order)
+tbl4_data = stats_month_by_table["tbl4"]
 
 # Remove the rows for "coll_severity_rank_num" and "city_travel_time" as they are not needed
-tbl4_data = tbl4_data[~tbl4_data["var.name"].isin(["coll_severity_rank_num_mean", "city_travel_time_mean"])].copy()
-
-# Dictionary for column labels and orders
-tbl4_labels = {
-    "party_number": {"label": "Parties", "var_order": 1},
-    "victim_number": {"label": "Victims", "var_order": 2},
-    "party_number_killed": {"label": "Killed Parties", "var_order": 3},
-    "party_number_inj": {"label": "Injured Parties", "var_order": 4},
-    "victim_degree_of_injury": {"label": "Victim Degree of Injury", "var_order": 5},
-    "coll_severity_num": {"label": "Severity", "var_order": 6},
-    "party_age": {"label": "Median Party Age", "var_order": 7},
-    "victim_age": {"label": "Median Victim Age", "var_order": 8},
-    "hit_and_run": {"label": "Hit and Run", "var_order": 9},
-    "distance": {"label": "Distance", "var_order": 10},
-    "lighting": {"label": "Lighting", "var_order": 11},
-    "vehicle_year_group": {"label": "Vehicle Year Group", "var_order": 12},
-    "city_area_sq_mi": {"label": "City Area (sq. mi)", "var_order": 13},
-    "city_pop_total": {"label": "City Population", "var_order": 14},
-    "city_hou_total": {"label": "City Housing Units", "var_order": 15},
-    "city_pop_dens": {"label": "City Population Density", "var_order": 16},
-    "city_hou_dens": {"label": "City Housing Density", "var_order": 17},
-    "city_pop_asian": {"label": "City Asian Population", "var_order": 18},
-    "city_pop_black": {"label": "City Black Population", "var_order": 19},
-    "city_pop_hispanic": {"label": "City Hispanic Population", "var_order": 20},
-    "city_pop_white": {"label": "City White Population", "var_order": 21},
-    "city_vehicles": {"label": "City Vehicles", "var_order": 22},
-    "city_mean_travel_time": {"label": "City Mean Travel Time", "var_order": 23},
-    "roads_primary": {"label": "City Primary Roads", "var_order": 24},
-    "roads_secondary": {"label": "City Secondary Roads", "var_order": 25},
-    "roads_local": {"label": "City Local Roads", "var_order": 26},
-    "road_length_mean": {"label": "City Mean Road Length", "var_order": 27},
-    "road_length_sum": {"label": "City Total Road Length", "var_order": 38},
-}
-
-
-# Remove the "_mean" or "_median" suffix from var.name
-tbl4_data["var.name"] = tbl4_data["var.name"].str.replace(r"_(mean|median)$", "", regex = True)
-
-# Add label and order columns based on tbl3_labels
-tbl4_data.loc[:, "label"] = tbl4_data["var.name"].map(lambda x: tbl4_labels[x]["label"])
-tbl4_data.loc[:, "order"] = tbl4_data["var.name"].map(lambda x: tbl4_labels[x]["var_order"])
-
-# Relocate the label and order columns
-octr.relocate_column(df = tbl4_data, col_name = "order", ref_col_name = "stat.type", position = "after")
-octr.relocate_column(df = tbl4_data, col_name = "label", ref_col_name = "order", position = "after")
+tbl4_data = tbl4_data[~tbl4_data["var.name"].isin(["coll_severity_rank_num_mean", "city_travel_time_mean"])]
+
+# Remove the "_mean" or "_median" suffix from var.name (with a precompiled pattern, as a categorical)
+tbl4_suffix_pattern = re.compile(r"_(mean|median)$")
+tbl4_var_names = tbl4_data["var.name"].str.replace(tbl4_suffix_pattern, "", regex = True).astype("category")
+
+# Replace var.name and add label, order, and group columns based on TBL4_LABELS (builds a single new data frame)
+tbl4_data = tbl4_data.assign(
+    **{
+        "var.name": tbl4_var_names,
+        "label": tbl4_var_names.map(tbl4_label_series),
+        "order": tbl4_var_names.map(tbl4_order_series).astype("int16"),
+        "group": tbl4_var_names.map(tbl4_group_series).astype("int16"),
+    }
+)
 
 # Remove the "var.name" column
 tbl4_data = tbl4_data.drop(columns = ["var.name"])
 # Reorder the columns by "order"
 tbl4_data = tbl4_data.sort_values("order")
 
-# Round float columns (2 decimal places) for mean, std.dev, min, max, and median
-for col in ["mean", "std.dev", "min", "max", "median"]:
-    if col in tbl4_data.columns:
-        tbl4_data.loc[:, col] = tbl4_data[col].astype(float).round(2)
+# Get the row positions where the variable group changes (a midrule is added before each)
+tbl4_midrule_rows = set((np.flatnonzero(np.diff(tbl4_data["group"].to_numpy())) + 1).tolist())
+
+# Round float columns (2 decimal places) for mean, std.dev, min, max, and median in one call
+tbl4_data = tbl4_data.round({"mean": 2, "std.dev": 2, "min": 2, "max": 2, "median": 2})
 
 # Keep only the specificied columns and reorder them
-cols = ["label", "mean", "min", "max", "std.dev", "median"]
-tbl4_data = tbl4_data[[col for col in cols if col in tbl4_data.columns]]
+tbl4_data = tbl4_data[[col for col in TBL4_COLS if col in tbl4_data.columns]]
 
 # Rename columns
-col_rename = {
-    "label": "Factor (Count or Bin)",
-    "mean": "Mean",
-    "min": "Min",
-    "max": "Max",
-    "std.dev": "SD",
-    "median": "Median",
-}
-tbl4_data = tbl4_data.rename(columns = col_rename)
-
-
-# Ensure that variables are floats with 3 decimal places
-for col in ["Mean", "Min", "Max", "SD", "Median"]:
-    if col in tbl4_data.columns:
-        tbl4_data[col] = tbl4_data[col].astype(float).round(3)
+tbl4_data = tbl4_data.rename(columns = TBL4_RENAME)
 
-# Format all numeric columns with a thousands comma separator if they have at least 4 digits
-for col in tbl4_data.columns:
-    if pd.api.types.is_numeric_dtype(tbl4_data[col]):
-        tbl4_data[col] = tbl4_data[col].apply(lambda x: f"{x:,}" if pd.notnull(x) and abs(x) >= 1000 else x)
-
-print(tbl4_data)
+# Print the data frame only in verbose runs
+if VERBOSE:
+    print(tbl4_data)
 
 
 ### Create Table 4 ----
 #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 print("\n- Create Table 4")
 
-tbl4_mod = tbl4_data.copy()
-# Convert all columns to string type
-tbl4_mod = tbl4_mod.astype(str)
-
-# Create the LaTeX table from the data frame
-tbl4_latex = tbl4_mod.to_latex(
-    buf = None,
-    columns = None,
-    header = True,
-    index = False,
-    na_rep = "NaN",
-    formatters = None,
-    float_format = None,
-    sparsify = None,
-    index_names = True,
-    bold_rows = False,
-    column_format = "lrrrrrrr",
-    longtable = False,
-    escape = False,
-    encoding = None,
-    decimal = ".",
-    multicolumn = True,
-    multicolumn_format = "c",
-    multirow = True,
-    caption = graphics_list["tables"]["tbl4"]["caption"],
-    label = graphics_list["tables"]["tbl4"]["id"].lower(),
-    position = None,
-)
-
-# Add option [h!] to the table
-tbl4_latex = tbl4_latex.replace("\\begin{table}", "\\begin{table}[h!]")
+# Footnote marks for the Severity, Hit and Run, and Lighting factor labels
+tbl4_label_marks = {"Severity": "Severity\\footnotemark[2]", "Hit and Run": "Hit and Run\\footnotemark[3]", "Lighting": "Lighting\\footnotemark[4]"}
 
-# Split the LaTeX table into lines for easier manipulation
-tbl4_latex_lines = tbl4_latex.splitlines()
+# Define the cell formatters: the factor labels with their footnote marks, and the numeric columns with a thousands comma separator (applied while the rows are emitted)
+tbl4_formatters = [lambda label: tbl4_label_marks.get(label, label)] + ["{:,}".format] * (tbl4_data.shape[1] - 1)
 
-# Replace line 5 with a custom header
+# Custom header line with the footnote marks
 header_line = r"Factor (Mean or Median) & Mean\footnotemark[1] & Min\footnotemark[1] & Max\footnotemark[1] & SD\footnotemark[1] & Median\footnotemark[1] \\"
-tbl4_latex_lines[5] = header_line
-
-
-midrule_idx = [12, 20, 32]
-for idx in midrule_idx:
-    # Insert a midrule after each specified index
-    tbl4_latex_lines.insert(idx, r"\midrule")
 
-# Join the lines back together
-tbl4_latex = "\n".join(tbl4_latex_lines)
-# Delete the temporary latex lines
-del tbl4_latex_lines
-
-tbl4_latex = tbl4_latex.replace("Severity", "Severity\\footnotemark[2]")
-tbl4_latex = tbl4_latex.replace("Hit and Run", "Hit and Run\\footnotemark[3]")
-tbl4_latex = tbl4_latex.replace("Lighting", "Lighting\\footnotemark[4]")
-
-# Add footnotes after the table
+# Footnotes to add after the table
 footnotes = (
     "\\footnotetext[1]{"
-    + f"Monthly generated cumulative summary time series from {prj_meta['date_start'].strftime('%m/%d/%Y')} through {prj_meta['date_end'].strftime('%m/%d/%Y')} (n = {len(ts_month['collisions'])})"
+    + f"Monthly generated cumulative summary time series from {date_start_str} through {date_end_str} (n = {len(ts_month['collisions'])})"
     + "}\n"
     "\\footnotetext[2]{Increasing ordinal severity rank from 0 (no injury) to 4 (fatal)}\n"
     "\\footnotetext[3]{Ordinal hit-and-run classification: 0 (No), 1 (Misdemeanor), 2 (Felony)}\n"
     "\\footnotetext[4]{Decreasing lighting intensity (higher value is darker conditions), from 1 to 4}"
 )
-if "\\end{tabular}" in tbl4_latex:
-    tbl4_latex = tbl4_latex.replace("\\end{tabular}", "\\end{tabular}\n" + footnotes)
-elif "\\end{longtable}" in tbl4_latex:
-    tbl4_latex = tbl4_latex.replace("\\end{longtable}", "\\end{longtable}\n" + footnotes)
-else:
-    tbl4_latex += "\n" + footnotes
 
-print(tbl4_latex)
+# Assemble the LaTeX table in a single pass: [h!] placement, custom header, rows with the group midrules, and the footnotes after the tabular
+tbl4_latex_parts = [
+    "\\begin{table}[h!]",
+    f"\\caption{{{graphics_list['tables']['tbl4']['caption']}}}",
+    f"\\label{{{graphics_list['tables']['tbl4']['id'].lower()}}}",
+    "\\begin{tabular}{lrrrrrrr}",
+    "\\toprule",
+    header_line,
+    "\\midrule",
+]
+for i, row in enumerate(tbl4_data.itertuples(index = False, name = None)):
+    if i in tbl4_midrule_rows:
+        tbl4_latex_parts.append("\\midrule")
+    # Format the row cells (missing values are shown as NaN)
+    tbl4_latex_parts.append(" & ".join("NaN" if pd.isna(value) else fmt(value) for fmt, value in zip(tbl4_formatters, row)) + " \\\\")
+tbl4_latex_parts.extend(["\\bottomrule", "\\end{tabular}", footnotes, "\\end{table}"])
+tbl4_latex = "\n".join(tbl4_latex_parts)
+
+# Print the LaTeX table only in verbose runs
+if VERBOSE:
+    print(tbl4_latex)
 
 
 # Define the path to save the LaTeX table
 tbl4_path = graphics_list["tables"]["tbl4"]["path"]
 # Save the LaTeX table to a file
-with open(tbl4_path, "w", encoding = "utf-8") as f:
-    f.write(tbl4_latex)
-    print(f"\n- Table 4 saved to {tbl4_path}")
+Path(tbl4_path).write_text(tbl4_latex, encoding = "utf-8")
+print(f"\n- Table 4 saved to {tbl4_path}")
 
 
 ### Save the Graphics Dataset ----
@@ -1502,8 +1440,8 @@ tbl4_dataset = {"data": tbl4_data, "latex": tbl4_latex}
 
 # Save the graphics dataset to disk
 tbl4_dataset_path = os.path.join(prj_dirs["data_python"], graphics_list["tables"]["tbl4"]["file"] + ".pkl")
-with open(tbl4_dataset_path, "wb") as f:
-    pickle.dump(tbl4_dataset, f)
+with open(tbl4_dataset_path, "wb", buffering = 1 << 20) as f:
+    pickle.dump(tbl4_dataset, f, protocol = 5)
     print(f"\n- Graphics dataset saved to {tbl4_dataset_path}")
 
 
@@ -1539,137 +1477,75 @@ graphics_list = octr.graphics_entry(
 #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 print("\n- Construct Summary Table")
 
-# Create a dataframe with selected columns from tsYear
-tbl5_data = ts_year["collisions"][
-    [
-        "crash_tag_sum",
-        "party_tag_sum",
-        "victim_tag_sum",
-        "number_killed_sum",
-        "number_inj_sum",
-        "count_severe_inj_sum",
-        "count_visible_inj_sum",
-        "count_complaint_pain_sum",
-        "count_car_killed_sum",
-        "count_car_inj_sum",
-        "count_ped_killed_sum",
-        "count_ped_inj_sum",
-        "count_bic_killed_sum",
-        "count_bic_inj_sum",
-        "count_mc_killed_sum",
-        "count_mc_inj_sum",
-    ]
-].copy()
+# Create a dataframe with the selected columns from tsYear, renamed to their display names (rename returns a new data frame, so no copy is needed)
+tbl5_data = ts_year["collisions"].loc[:, list(TBL5_COLS)].rename(columns = dict(zip(TBL5_COLS, TBL5_NAMES)))
 
 # Extract years from dateYear column and set them as the DataFrame index
 tbl5_data.index = ts_year["collisions"]["date_year"].datetime.year
 
-# Rename the columns of the tbl5_data data frame
-tbl5_data.columns = [
-    "Crashes",
-    "Parties",
-    "Victims",
-    "Fatal",
-    "Injuries Total",
-    "Injuries Severe",
-    "Injuries Visible",
-    "Injuries Pain",
-    "Cars Killed",
-    "Cars Injured",
-    "Pedestrians Killed",
-    "Pedestrians Injured",
-    "Bicyclists Killed",
-    "Bicyclists Injured",
-    "Motorcyclists Killed",
-    "Motorcyclists Injured",
-]
-
 
-# Add summary statistics rows (total, mean, sd) to the bottom of the DataFrame
-total_row = tbl5_data.sum(axis = 0).round(0)
-mean_row = tbl5_data.mean(axis = 0).round(0)
-std_row = tbl5_data.std(axis = 0).round(0)
-
-# Create a new DataFrame with the statistics rows and concatenate with the original
-stats_df = pd.DataFrame([total_row, mean_row, std_row], index = ["Total", "Mean", "SD"])
+# Compute the summary statistics rows (total, mean, sd) in a single aggregation
+stats_df = tbl5_data.agg(["sum", "mean", "std"]).round(0)
+stats_df.index = ["Total", "Mean", "SD"]
 
 # Concatenate the original DataFrame with the statistics DataFrame
 tbl5_data = pd.concat([tbl5_data, stats_df])
 
-# Add thousand separators to the numeric columns
-for col in tbl5_data.columns:
-    tbl5_data[col] = tbl5_data[col].map(lambda x: f"{x:,.0f}" if isinstance(x, (int, float)) else x)
-
 # Add a new column with the year extracted from the index
 tbl5_data["Year"] = tbl5_data.index
 # Reorder the columns to have 'Year' as the first column
 tbl5_data = tbl5_data[["Year"] + [col for col in tbl5_data.columns if col != "Year"]]
 
-print(tbl5_data)
+# Print the data frame only in verbose runs
+if VERBOSE:
+    print(tbl5_data)
 
 
 ### Create Table 5 ----
 #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 print("\n- Create Table 5")
 
-
-# Convert all columns to string type
-tbl5_mod = tbl5_data.copy().astype(str)
-
-# Create the LaTeX table from the data frame
-tbl5_latex = tbl5_mod.to_latex(
-    buf = None,
-    columns = None,
-    header = True,
-    index = False,
-    na_rep = "NaN",
-    formatters = None,
-    float_format = None,
-    sparsify = None,
-    index_names = True,
-    bold_rows = False,
-    column_format = "crrrrrrrrrrrrrrrr",
-    longtable = False,
-    escape = False,
-    encoding = None,
-    decimal = ".",
-    multicolumn = True,
-    multicolumn_format = "c",
-    multirow = True,
-    caption = graphics_list["tables"]["tbl5"]["caption"],
-    label = graphics_list["tables"]["tbl5"]["id"].lower(),
-    position = None,
-)
-
-# Change the LaTeX table to use the 'sidewaystable' style
-tbl5_latex = tbl5_latex.replace("\\begin{table}", "\\begin{sidewaystable}[ht!]")
-tbl5_latex = tbl5_latex.replace("\\end{table}", "\\end{sidewaystable}")
-
-# Replace the header rows with custom formatting
-tbl5_latex = tbl5_latex.replace("Year & Crashes & Parties & Victims & Fatal & Injuries Total & Injuries Severe & Injuries Visible & Injuries Pain & Cars Killed & Cars Injured & Pedestrians Killed & Pedestrians Injured & Bicyclists Killed & Bicyclists Injured & Motorcyclists Killed & Motorcyclists Injured", "\\multirow[c]{2}{*}{Year} & \\multicolumn{1}{c}{\\multirow{2}{*}{Crashes}} & \\multicolumn{1}{c}{\\multirow{2}{*}{Parties}} & \\multicolumn{1}{c}{\\multirow{2}{*}{Victims}} & \\multicolumn{1}{c}{\\multirow{2}{*}{Fatal}} & \\multicolumn{4}{c}{Injuries} & \\multicolumn{2}{c}{Cars} & \\multicolumn{2}{c}{Pedestrians} & \\multicolumn{2}{c}{Bicyclists} & \\multicolumn{2}{c}{Motorcyclists} \\\\\n\\cmidrule{6-9}\\cmidrule{10-11}\\cmidrule{12-13}\\cmidrule{14-15}\\cmidrule{16-17}\n&  &  &  &  & {Total} & {Severe} & {Visible} & {Pain} & {Killed} & {Injured} & {Killed} & {Injured} & {Killed} & {Injured} & {Killed} & {Injured}"
-)
-
-# Add midrule for better readability
-tbl5_latex = tbl5_latex.replace("Total &", "\\midrule\nTotal &")
-
-
 # Add footnote for the table
 footnote = (
     "\\footnotesize{"
-    + f"Note: Data cover annual time series from {prj_meta['date_start'].strftime('%m/%d/%Y')} through {prj_meta['date_end'].strftime('%m/%d/%Y')} (n = {len(ts_year['collisions'])})"
+    + f"Note: Data cover annual time series from {date_start_str} through {date_end_str} (n = {len(ts_year['collisions'])})"
     + "}"
 )
 
-tbl5_latex = tbl5_latex.replace("\\end{tabular}", "\\end{tabular}\n" + footnote)
+# Define the cell formatters: the year labels as is, and the numeric columns with a thousands comma separator and no decimals (applied while the rows are emitted)
+tbl5_formatters = [str] + ["{:,.0f}".format] * (tbl5_data.shape[1] - 1)
+
+# Format the table rows in a single pass and locate the summary rows
+tbl5_rows = [" & ".join(fmt(value) for fmt, value in zip(tbl5_formatters, row)) + " \\\\" for row in tbl5_data.itertuples(index = False, name = None)]
+tbl5_total_idx = tbl5_data.index.get_loc("Total")
+
+# Assemble the LaTeX table: sidewaystable, the two-level header, the yearly rows, a midrule before the summary rows, and the footnote after the tabular
+tbl5_latex = "\n".join(
+    [
+        "\\begin{sidewaystable}[ht!]",
+        f"\\caption{{{graphics_list['tables']['tbl5']['caption']}}}",
+        f"\\label{{{graphics_list['tables']['tbl5']['id'].lower()}}}",
+        TBL5_HEADER,
+        *tbl5_rows[:tbl5_total_idx],
+        "\\midrule",
+        *tbl5_rows[tbl5_total_idx:],
+        "\\bottomrule",
+        "\\end{tabular}",
+        footnote,
+        "\\end{sidewaystable}",
+        "",
+    ]
+)
 
-print(tbl5_latex)
+# Print the LaTeX table only in verbose runs
+if VERBOSE:
+    print(tbl5_latex)
 
 # Define the path to save the LaTeX table
 tbl5_path = graphics_list["tables"]["tbl5"]["path"]
 # Save the LaTeX table to a file
-with open(tbl5_path, "w", encoding = "utf-8") as f:
-    f.write(tbl5_latex)
-    print(f"\n- Table 5 saved to {tbl5_path}")
+Path(tbl5_path).write_bytes(tbl5_latex.encode("utf-8"))
+print(f"\n- Table 5 saved to {tbl5_path}")
 
 
 ### Save the Graphics Dataset ----
@@ -1681,8 +1557,9 @@ tbl5_dataset = {"data": tbl5_data, "latex": tbl5_latex}
 
 # Save the graphics dataset to disk
 tbl5_dataset_path = os.path.join(prj_dirs["data_python"], graphics_list["tables"]["tbl5"]["file"] + ".pkl")
-with open(tbl5_dataset_path, "wb") as f:
-    pickle.dump(tbl5_dataset, f)
+with open(tbl5_dataset_path, "wb", buffering = 1 << 20) as f:
+    pickle.dump(tbl5_dataset, f, protocol = 5)
+    print(f"\n- Graphics dataset saved to {tbl5_dataset_path}")
 
 
 #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -1690,11 +1567,11 @@ with open(tbl5_dataset_path, "wb") as f:
 #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 print("\n3. Save the Time Series Data")
 
-# Save the data to disk
+# Save the data to disk (only the graphics metadata is updated by this script)
 octr.save_to_disk(
     dir_list = prj_dirs,
-    local_vars = locals(),
-    global_vars = globals()
+    local_vars = {"graphics_list": graphics_list},
+    global_vars = {}
 )
 
 
@@ -23,7 +23,16 @@ print("\n1.1. Libraries and Initialization")
 # Import necessary libraries
 import os
 import datetime
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import pandas as pd
+import matplotlib
+
+# Use the non-interactive Agg backend in batch runs (figures are only saved, not shown)
+BATCH_MODE = bool(os.environ.get("OCTRAFFIC_BATCH"))
+if BATCH_MODE:
+    matplotlib.use("Agg")
+
 import matplotlib.pyplot as plt
 from dotenv import load_dotenv
 
@@ -36,6 +45,12 @@ octr = OCTraffic(part = 5, version = 2025.3)
 plt.rcParams["font.family"] = "serif"
 plt.rcParams["font.serif"] = ["Times New Roman"]
 
+# PNG encoder options for all saved figures (a fast zlib level: much quicker to encode, at the cost of somewhat larger files)
+PNG_KWARGS = {"compress_level": 1}
+
+# Resolution of the section 2.2 STL diagnostic figures (not part of the graphics list; the published figures use their graphics list resolution)
+DIAGNOSTIC_DPI = 150
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -66,65 +81,57 @@ print(f"\nCurrent working directory: {os.getcwd()}\n")
 #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 print("\n1.3. Loading Collisions Data from Disk")
 
-# Load the crashes pickle data file
-print("- Loading the crashes pickle data file")
-crashes = pd.read_pickle(os.path.join(prj_dirs["data_python"], "crashes.pkl"))
-
-# load the parties pickle data file
-print("- Loading the parties pickle data file")
-parties = pd.read_pickle(os.path.join(prj_dirs["data_python"], "parties.pkl"))
-
-# load the victims pickle data file
-print("- Loading the victims pickle data file")
-victims = pd.read_pickle(os.path.join(prj_dirs["data_python"], "victims.pkl"))
-
-# load the collisions pickle data file
-print("- Loading the collisions pickle data file")
-collisions = pd.read_pickle(os.path.join(prj_dirs["data_python"], "collisions.pkl"))
-
-# load the cities pickle data file
-print("- Loading the cities pickle data file")
-cities = pd.read_pickle(os.path.join(prj_dirs["data_python"], "cities.pkl"))
-
-# load the roads pickle data file
-print("- Loading the roads pickle data file")
-roads = pd.read_pickle(os.path.join(prj_dirs["data_python"], "roads.pkl"))
-
-# load the blocks pickle data file
-print("- Loading the blocks pickle data file")
-blocks = pd.read_pickle(os.path.join(prj_dirs["data_python"], "blocks.pkl"))
-
-# load the boundaries pickle data file
-print("- Loading the boundaries pickle data file")
-boundaries = pd.read_pickle(os.path.join(prj_dirs["data_python"], "boundaries.pkl"))
-
-# load the data dictionary pickle data file
-print("- Loading the data dictionary pickle data file")
-data_dict = pd.read_pickle(os.path.join(prj_dirs["data_python"], "data_dict.pkl"))
-
-# load the ts_year pickle data file
-print("- Loading the ts_year pickle data file")
-ts_year = pd.read_pickle(os.path.join(prj_dirs["data_python"], "ts_year.pkl"))
-
-# load the ts_quarter pickle data file
-print("- Loading the ts_quarter pickle data file")
-ts_quarter = pd.read_pickle(os.path.join(prj_dirs["data_python"], "ts_quarter.pkl"))
-
-# load the ts_month pickle data file
-print("- Loading the ts_month pickle data file")
-ts_month = pd.read_pickle(os.path.join(prj_dirs["data_python"], "ts_month.pkl"))
-
-# load the ts_week pickle data file
-print("- Loading the ts_week pickle data file")
-ts_week = pd.read_pickle(os.path.join(prj_dirs["data_python"], "ts_week.pkl"))
-
-# load the ts_day pickle data file
-print("- Loading the ts_day pickle data file")
-ts_day = pd.read_pickle(os.path.join(prj_dirs["data_python"], "ts_day.pkl"))
+# Pickle data files used in this part (variable name: file name)
+data_files = {
+    "collisions": "collisions.pkl",
+    "ts_quarter": "ts_quarter.pkl",
+    "ts_month": "ts_month.pkl",
+    "ts_week": "ts_week.pkl",
+    "ts_day": "ts_day.pkl",
+    "graphics_list": "graphics_list.pkl",
+}
 
-# Load the graphics_list pickle data file
-print("- Loading the graphics_list pickle data file")
-graphics_list = pd.read_pickle(os.path.join(prj_dirs["data_python"], "graphics_list.pkl"))
+# Pickle data files not used in this part (loaded only when OCTRAFFIC_LOAD_ALL=1, e.g., for interactive work)
+LOAD_ALL = os.environ.get("OCTRAFFIC_LOAD_ALL", "0") == "1"
+optional_data_files = {
+    "crashes": "crashes.pkl",
+    "parties": "parties.pkl",
+    "victims": "victims.pkl",
+    "cities": "cities.pkl",
+    "roads": "roads.pkl",
+    "blocks": "blocks.pkl",
+    "boundaries": "boundaries.pkl",
+    "data_dict": "data_dict.pkl",
+    "ts_year": "ts_year.pkl",
+}
+if LOAD_ALL:
+    data_files.update(optional_data_files)
+
+# Load the pickle data files in parallel (the reads are I/O bound, so a thread pool overlaps them)
+print("- Loading the " + ", ".join(data_files) + " pickle data files")
+with ThreadPoolExecutor(max_workers = 8) as executor:
+    loaded_data = dict(
+        zip(data_files, executor.map(lambda file: pd.read_pickle(os.path.join(prj_dirs["data_python"], file)), data_files.values()))
+    )
+
+# Assign the loaded data to their variable names
+collisions = loaded_data["collisions"]
+ts_quarter = loaded_data["ts_quarter"]
+ts_month = loaded_data["ts_month"]
+ts_week = loaded_data["ts_week"]
+ts_day = loaded_data["ts_day"]
+graphics_list = loaded_data["graphics_list"]
+if LOAD_ALL:
+    crashes = loaded_data["crashes"]
+    parties = loaded_data["parties"]
+    victims = loaded_data["victims"]
+    cities = loaded_data["cities"]
+    roads = loaded_data["roads"]
+    blocks = loaded_data["blocks"]
+    boundaries = loaded_data["boundaries"]
+    data_dict = loaded_data["data_dict"]
+    ts_year = loaded_data["ts_year"]
+del loaded_data
 
 
 #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -152,53 +159,26 @@ print("\n2. Seasonal Time Series Analysis")
 #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 print("\n2.1. Create Time Series Objects")
 
-# Number of crashes (crash_tag_sum) per time period
-ts_list_crashes = {
-    "quarter": ts_quarter["crashes"]["crash_tag_sum"],
-    "month": ts_month["crashes"]["crash_tag_sum"],
-    "week": ts_week["crashes"]["crash_tag_sum"],
-    "day": ts_day["crashes"]["crash_tag_sum"],
+# Crashes time series data frames per time period (each looked up once)
+ts_periods = {
+    "quarter": ts_quarter["crashes"],
+    "month": ts_month["crashes"],
+    "week": ts_week["crashes"],
+    "day": ts_day["crashes"],
 }
 
-# Number of victims (victim_count_sum) per time period
-ts_list_victims = {
-    "quarter": ts_quarter["crashes"]["victim_count_sum"],
-    "month": ts_month["crashes"]["victim_count_sum"],
-    "week": ts_week["crashes"]["victim_count_sum"],
-    "day": ts_day["crashes"]["victim_count_sum"],
+# Time series variables: number of crashes, number of victims, fatal accidents, fatal or severe accidents, number of injuries, and mean collision severity
+ts_metrics = {
+    "crashes": "crash_tag_sum",
+    "victims": "victim_count_sum",
+    "fatal": "number_killed_sum",
+    "fatal_severe": "count_fatal_severe_sum",
+    "injuries": "number_inj_sum",
+    "severity": "coll_severity_num_mean",
 }
 
-# Number of fatal accidents (number_killed_sum) per time period
-ts_list_fatal = {
-    "quarter": ts_quarter["crashes"]["number_killed_sum"],
-    "month": ts_month["crashes"]["number_killed_sum"],
-    "week": ts_week["crashes"]["number_killed_sum"],
-    "day": ts_day["crashes"]["number_killed_sum"],
-}
-
-# Fatal or severe accidents (count_fatal_severe_sum) per time period
-ts_list_fatal_severe = {
-    "quarter": ts_quarter["crashes"]["count_fatal_severe_sum"],
-    "month": ts_month["crashes"]["count_fatal_severe_sum"],
-    "week": ts_week["crashes"]["count_fatal_severe_sum"],
-    "day": ts_day["crashes"]["count_fatal_severe_sum"],
-}
-
-# Number of injuries (number_inj_sum) per time period
-ts_list_injuries = {
-    "quarter": ts_quarter["crashes"]["number_inj_sum"],
-    "month": ts_month["crashes"]["number_inj_sum"],
-    "week": ts_week["crashes"]["number_inj_sum"],
-    "day": ts_day["crashes"]["number_inj_sum"],
-}
-
-# Mean collision severity (coll_severity_num_mean) per time period
-ts_list_severity = {
-    "quarter": ts_quarter["crashes"]["coll_severity_num_mean"],
-    "month": ts_month["crashes"]["coll_severity_num_mean"],
-    "week": ts_week["crashes"]["coll_severity_num_mean"],
-    "day": ts_day["crashes"]["coll_severity_num_mean"],
-}
+# Time series for each variable per time period (e.g., ts_lists["crashes"]["month"])
+ts_lists = {metric: {period: df[col] for period, df in ts_periods.items()} for metric, col in ts_metrics.items()}
 
 
 #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -206,6 +186,13 @@ ts_list_severity = {
 #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 print("\n2.2. Decompose Time Series")
 
+# Create a single figure that is cleared and redrawn for each STL decomposition below (each plot is saved before the next one is drawn)
+# (created at the diagnostic output resolution, so that the figures are saved at the figure dpi without rescaling)
+fig_stl = plt.figure(figsize = (12, 10), dpi = DIAGNOSTIC_DPI)
+
+# Directory of cached STL decomposition results (reused by later runs while the input time series are unchanged)
+stl_cache_dir = os.path.join(prj_dirs["data_python"], "stl_cache")
+
 
 ### Number of Crashes ----
 #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -213,11 +200,11 @@ print("\n- Number of Crashes")
 
 # Create the STL decomposition for the monthly crashes time series
 stl_m_crashes, fig_m_crashes = octr.create_stl_plot(
-    ts_list_crashes["month"], season = "monthly", model = "additive", label = "Number of Crashes", covid = False, robust = True
+    ts_lists["crashes"]["month"], season = "monthly", model = "additive", label = "Number of Crashes", covid = False, robust = True, fig = fig_stl, cache_dir = stl_cache_dir
 )
 
 # Save the figure to disk
-fig_m_crashes.savefig(os.path.join(prj_dirs["graphics"], "fig_m_crashes.png"), dpi = 300, bbox_inches = "tight")
+fig_m_crashes.savefig(os.path.join(prj_dirs["graphics"], "fig_m_crashes.png"), dpi = "figure", bbox_inches = "tight", pil_kwargs = PNG_KWARGS)
 
 # Show the figure
 # fig_m_crashes.show()
@@ -225,11 +212,11 @@ fig_m_crashes.savefig(os.path.join(prj_dirs["graphics"], "fig_m_crashes.png"), d
 
 # Create the STL decomposition for the weekly crashes time series
 stl_w_crashes, fig_w_crashes = octr.create_stl_plot(
-    ts_list_crashes["week"], season = "weekly", model = "additive", label = "Number of Crashes", covid = False, robust = True
+    ts_lists["crashes"]["week"], season = "weekly", model = "additive", label = "Number of Crashes", covid = False, robust = True, fig = fig_stl, cache_dir = stl_cache_dir
 )
 
 # Save the figure to disk
-fig_w_crashes.savefig(os.path.join(prj_dirs["graphics"], "fig_w_crashes.png"), dpi = 300, bbox_inches = "tight")
+fig_w_crashes.savefig(os.path.join(prj_dirs["graphics"], "fig_w_crashes.png"), dpi = "figure", bbox_inches = "tight", pil_kwargs = PNG_KWARGS)
 
 # Show the figure
 # fig_w_crashes.show()
@@ -242,11 +229,11 @@ print("\n- Number of Victims")
 
 # Create the STL decomposition for the monthly victims time series
 stl_m_victims, fig_m_victims = octr.create_stl_plot(
-    ts_list_victims["month"], season = "monthly", model = "additive", label = "Number of Victims", covid = False, robust = True
+    ts_lists["victims"]["month"], season = "monthly", model = "additive", label = "Number of Victims", covid = False, robust = True, fig = fig_stl, cache_dir = stl_cache_dir
 )
 
 # Save the figure to disk
-fig_m_victims.savefig(os.path.join(prj_dirs["graphics"], "fig_m_victims.png"), dpi = 300, bbox_inches = "tight")
+fig_m_victims.savefig(os.path.join(prj_dirs["graphics"], "fig_m_victims.png"), dpi = "figure", bbox_inches = "tight", pil_kwargs = PNG_KWARGS)
 
 # Show the figure
 # fig_m_victims.show()
@@ -254,11 +241,11 @@ fig_m_victims.savefig(os.path.join(prj_dirs["graphics"], "fig_m_victims.png"), d
 
 # Create the STL decomposition for the weekly victims time series
 stl_w_victims, fig_w_victims = octr.create_stl_plot(
-    ts_list_victims["week"], season = "weekly", model = "additive", label = "Number of Victims", covid = False, robust = True
+    ts_lists["victims"]["week"], season = "weekly", model = "additive", label = "Number of Victims", covid = False, robust = True, fig = fig_stl, cache_dir = stl_cache_dir
 )
 
 # Save the figure to disk
-fig_w_victims.savefig(os.path.join(prj_dirs["graphics"], "fig_w_victims.png"), dpi = 300, bbox_inches = "tight")
+fig_w_victims.savefig(os.path.join(prj_dirs["graphics"], "fig_w_victims.png"), dpi = "figure", bbox_inches = "tight", pil_kwargs = PNG_KWARGS)
 
 # Show the figure
 # fig_w_victims.show()
@@ -271,11 +258,11 @@ print("\n- Fatal Accidents")
 
 # Create the STL decomposition for the monthly fatal accidents time series
 stl_m_fatal, fig_m_fatal = octr.create_stl_plot(
-    ts_list_fatal["month"], season = "monthly", model = "additive", label = "Fatal Accidents", covid = False, robust = True
+    ts_lists["fatal"]["month"], season = "monthly", model = "additive", label = "Fatal Accidents", covid = False, robust = True, fig = fig_stl, cache_dir = stl_cache_dir
 )
 
 # Save the figure to disk
-fig_m_fatal.savefig(os.path.join(prj_dirs["graphics"], "fig_m_fatal.png"), dpi = 300, bbox_inches = "tight")
+fig_m_fatal.savefig(os.path.join(prj_dirs["graphics"], "fig_m_fatal.png"), dpi = "figure", bbox_inches = "tight", pil_kwargs = PNG_KWARGS)
 
 # Show the figure
 # fig_m_fatal.show()
@@ -283,11 +270,11 @@ fig_m_fatal.savefig(os.path.join(prj_dirs["graphics"], "fig_m_fatal.png"), dpi =
 
 # Create the STL decomposition for the weekly fatal accidents time series
 stl_w_fatal, fig_w_fatal = octr.create_stl_plot(
-    ts_list_fatal["week"], season = "weekly", model = "additive", label = "Fatal Accidents", covid = False, robust = True
+    ts_lists["fatal"]["week"], season = "weekly", model = "additive", label = "Fatal Accidents", covid = False, robust = True, fig = fig_stl, cache_dir = stl_cache_dir
 )
 
 # Save the figure to disk
-fig_w_fatal.savefig(os.path.join(prj_dirs["graphics"], "fig_w_fatal.png"), dpi = 300, bbox_inches = "tight")
+fig_w_fatal.savefig(os.path.join(prj_dirs["graphics"], "fig_w_fatal.png"), dpi = "figure", bbox_inches = "tight", pil_kwargs = PNG_KWARGS)
 
 # Show the figure
 # fig_w_fatal.show()
@@ -300,16 +287,18 @@ print("\n- Fatal or Severe Accidents")
 
 # Create the STL decomposition for the monthly fatal or severe accidents time series
 stl_m_fatal_severe, fig_m_fatal_severe = octr.create_stl_plot(
-    ts_list_fatal_severe["month"],
+    ts_lists["fatal_severe"]["month"],
     season = "monthly",
     model = "additive",
     label = "Fatal or Severe Accidents",
     covid = False,
     robust = True,
+    fig = fig_stl,
+    cache_dir = stl_cache_dir,
 )
 
 # Save the figure to disk
-fig_m_fatal_severe.savefig(os.path.join(prj_dirs["graphics"], "fig_m_fatal_severe.png"), dpi = 300, bbox_inches = "tight")
+fig_m_fatal_severe.savefig(os.path.join(prj_dirs["graphics"], "fig_m_fatal_severe.png"), dpi = "figure", bbox_inches = "tight", pil_kwargs = PNG_KWARGS)
 
 # Show the figure
 # fig_m_fatal_severe.show()
@@ -317,16 +306,18 @@ fig_m_fatal_severe.savefig(os.path.join(prj_dirs["graphics"], "fig_m_fatal_sever
 
 # Create the STL decomposition for the weekly fatal or severe accidents time series
 stl_w_fatal_severe, fig_w_fatal_severe = octr.create_stl_plot(
-    ts_list_fatal_severe["week"],
+    ts_lists["fatal_severe"]["week"],
     season = "weekly",
     model = "additive",
     label = "Fatal or Severe Accidents",
     covid = False,
     robust = True,
+    fig = fig_stl,
+    cache_dir = stl_cache_dir,
 )
 
 # Save the figure to disk
-fig_w_fatal_severe.savefig(os.path.join(prj_dirs["graphics"], "fig_w_fatal_severe.png"), dpi = 300, bbox_inches = "tight")
+fig_w_fatal_severe.savefig(os.path.join(prj_dirs["graphics"], "fig_w_fatal_severe.png"), dpi = "figure", bbox_inches = "tight", pil_kwargs = PNG_KWARGS)
 
 # Show the figure
 # fig_w_fatal_severe.show()
@@ -339,11 +330,11 @@ print("\n- Number of Injuries")
 
 # Create the STL decomposition for the monthly injuries time series
 stl_m_injuries, fig_m_injuries = octr.create_stl_plot(
-    ts_list_injuries["month"], season = "monthly", model = "additive", label = "Number of Injuries", covid = False, robust = True
+    ts_lists["injuries"]["month"], season = "monthly", model = "additive", label = "Number of Injuries", covid = False, robust = True, fig = fig_stl, cache_dir = stl_cache_dir
 )
 
 # Save the figure to disk
-fig_m_injuries.savefig(os.path.join(prj_dirs["graphics"], "fig_m_injuries.png"), dpi = 300, bbox_inches = "tight")
+fig_m_injuries.savefig(os.path.join(prj_dirs["graphics"], "fig_m_injuries.png"), dpi = "figure", bbox_inches = "tight", pil_kwargs = PNG_KWARGS)
 
 # Show the figure
 # fig_m_injuries.show()
@@ -351,11 +342,11 @@ fig_m_injuries.savefig(os.path.join(prj_dirs["graphics"], "fig_m_injuries.png"),
 
 # Create the STL decomposition for the weekly injuries time series
 stl_w_injuries, fig_w_injuries = octr.create_stl_plot(
-    ts_list_injuries["week"], season = "weekly", model = "additive", label = "Number of Injuries", covid = False, robust = True
+    ts_lists["injuries"]["week"], season = "weekly", model = "additive", label = "Number of Injuries", covid = False, robust = True, fig = fig_stl, cache_dir = stl_cache_dir
 )
 
 # Save the figure to disk
-fig_w_injuries.savefig(os.path.join(prj_dirs["graphics"], "fig_w_injuries.png"), dpi = 300, bbox_inches = "tight")
+fig_w_injuries.savefig(os.path.join(prj_dirs["graphics"], "fig_w_injuries.png"), dpi = "figure", bbox_inches = "tight", pil_kwargs = PNG_KWARGS)
 
 # Show the figure
 # fig_w_injuries.show()
@@ -368,16 +359,18 @@ print("\n- Mean Collision Severity")
 
 # Create the STL decomposition for the monthly mean collision severity time series
 stl_m_severity, fig_m_severity = octr.create_stl_plot(
-    ts_list_severity["month"],
+    ts_lists["severity"]["month"],
     season = "monthly",
     model = "additive",
     label = "Mean Collision Severity",
     covid = False,
     robust = True,
+    fig = fig_stl,
+    cache_dir = stl_cache_dir,
 )
 
 # Save the figure to disk
-fig_m_severity.savefig(os.path.join(prj_dirs["graphics"], "fig_m_severity.png"), dpi = 300, bbox_inches = "tight")
+fig_m_severity.savefig(os.path.join(prj_dirs["graphics"], "fig_m_severity.png"), dpi = "figure", bbox_inches = "tight", pil_kwargs = PNG_KWARGS)
 
 # Show the figure
 # fig_m_severity.show()
@@ -385,21 +378,26 @@ fig_m_severity.savefig(os.path.join(prj_dirs["graphics"], "fig_m_severity.png"),
 
 # Create the STL decomposition for the weekly mean collision severity time series
 stl_w_severity, fig_w_severity = octr.create_stl_plot(
-    ts_list_severity["week"],
+    ts_lists["severity"]["week"],
     season = "weekly",
     model = "additive",
     label = "Mean Collision Severity",
     covid = False,
     robust = True,
+    fig = fig_stl,
+    cache_dir = stl_cache_dir,
 )
 
 # Save the figure to disk
-fig_w_severity.savefig(os.path.join(prj_dirs["graphics"], "fig_w_severity.png"), dpi = 300, bbox_inches = "tight")
+fig_w_severity.savefig(os.path.join(prj_dirs["graphics"], "fig_w_severity.png"), dpi = "figure", bbox_inches = "tight", pil_kwargs = PNG_KWARGS)
 
 # Show the figure
 # fig_w_severity.show()
 # plt.close(fig_w_severity)
 
+# Close the shared STL figure
+plt.close(fig_stl)
+
 
 #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 ## 2.3. Figure 4 - monthly Fatalities Time Series ----
@@ -437,11 +435,12 @@ graphics_list = octr.graphics_entry(
 #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 print("\n- Create the Overlay Figure")
 
-# Create the monthly fatalities time series figure
-fig4, ax = octr.create_monthly_fatalities_figure(ts_month)
-# Show the figure
-fig4.show()
-plt.close(fig4)
+# Create the monthly fatalities time series figure once, for both showing and saving
+# (batch runs create it at the output resolution, so it is saved at the figure dpi without rescaling)
+fig4, ax = octr.create_monthly_fatalities_figure(ts_month, dpi = graphics_list["graphics"]["fig4"]["resolution"] if BATCH_MODE else None)
+# Show the figure (interactive runs only)
+if not BATCH_MODE:
+    fig4.show()
 
 
 ### Save the Figure ----
@@ -449,7 +448,6 @@ plt.close(fig4)
 print("\n- Save the Figure")
 
 # Save the figure to a file
-fig4, ax = octr.create_monthly_fatalities_figure(ts_month)
 fig4.savefig(
     fname = graphics_list["graphics"]["fig4"]["path"],
     transparent = True,
@@ -461,6 +459,7 @@ fig4.savefig(
     facecolor = "auto",
     edgecolor = "auto",
     backend = None,
+    pil_kwargs = PNG_KWARGS,
 )
 plt.close(fig4)
 
@@ -501,13 +500,14 @@ graphics_list = octr.graphics_entry(
 #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 print("\n- Create the STL Decomposition Figure")
 
-# Create the STL decomposition for the weekly crashes time series
+# Create the STL decomposition figure for the weekly crashes time series (reusing the decomposition fitted in section 2.2)
 stl_w_crashes, fig5 = octr.create_stl_plot(
-    ts_list_crashes["week"], season = "weekly", model = "additive", label = "Number of Crashes", covid = True, robust = True
+    ts_lists["crashes"]["week"], season = "weekly", model = "additive", label = "Number of Crashes", covid = True, robust = True, decomposition = stl_w_crashes
 )
 
-# Show the figure
-fig5.show()
+# Show the figure (interactive runs only)
+if not BATCH_MODE:
+    fig5.show()
 # plt.close(fig5)
 
 
@@ -527,6 +527,7 @@ fig5.savefig(
     facecolor = "auto",
     edgecolor = "auto",
     backend = None,
+    pil_kwargs = PNG_KWARGS,
 )
 plt.close(fig5)
 
@@ -567,13 +568,14 @@ graphics_list = octr.graphics_entry(
 #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 print("\n- Create the STL Decomposition Figure")
 
-# Create the STL decomposition for the weekly fatal accidents time series
+# Create the STL decomposition figure for the weekly fatal accidents time series (reusing the decomposition fitted in section 2.2)
 stl_w_fatal, fig6 = octr.create_stl_plot(
-    ts_list_fatal["week"], season = "weekly", model = "additive", label = "Fatal Accidents", covid = True, robust = True
+    ts_lists["fatal"]["week"], season = "weekly", model = "additive", label = "Fatal Accidents", covid = True, robust = True, decomposition = stl_w_fatal
 )
 
-# Show the figure
-fig6.show()
+# Show the figure (interactive runs only)
+if not BATCH_MODE:
+    fig6.show()
 # plt.close(fig6)
 
 
@@ -593,6 +595,7 @@ fig6.savefig(
     facecolor = "auto",
     edgecolor = "auto",
     backend = None,
+    pil_kwargs = PNG_KWARGS,
 )
 plt.close(fig6)
 
@@ -633,18 +636,20 @@ graphics_list = octr.graphics_entry(
 #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 print("\n- Create the STL Decomposition Figure")
 
-# Create the STL decomposition for the weekly mean collision severity time series
+# Create the STL decomposition figure for the weekly mean collision severity time series (reusing the decomposition fitted in section 2.2)
 stl_w_severity, fig7 = octr.create_stl_plot(
-    ts_list_severity["week"],
+    ts_lists["severity"]["week"],
     season = "weekly",
     model = "additive",
     label = "Mean Collision Severity",
     covid = True,
     robust = True,
+    decomposition = stl_w_severity,
 )
 
-# Show the figure
-fig7.show()
+# Show the figure (interactive runs only)
+if not BATCH_MODE:
+    fig7.show()
 # plt.close(fig7)
 
 
@@ -664,6 +669,7 @@ fig7.savefig(
     facecolor = "auto",
     edgecolor = "auto",
     backend = None,
+    pil_kwargs = PNG_KWARGS,
 )
 plt.close(fig7)
 
@@ -704,31 +710,37 @@ graphics_list = octr.graphics_entry(
 #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 print("\n- Create the Overlap Figure")
 
-# Define the time series data for Figure 8 (weekly number of victims vs. mean collision severity)
-fig8_data = ts_week["crashes"][["date_week", "victim_count_sum", "coll_severity_num_mean"]].copy()
+# Define the time series data for Figure 8 (weekly number of victims vs. mean collision severity), with the columns renamed for clarity
+fig8_data = ts_week["crashes"][["date_week", "victim_count_sum", "coll_severity_num_mean"]].rename(
+    columns = {"date_week": "time", "victim_count_sum": "victims", "coll_severity_num_mean": "severity"}
+)
 
-# Calculate z-scores for standardization (equivalent to R's scale function)
-fig8_data["z_victims"] = (fig8_data["victim_count_sum"] - fig8_data["victim_count_sum"].mean()) / fig8_data["victim_count_sum"].std()
-fig8_data["z_severity"] = (
-fig8_data["coll_severity_num_mean"] - fig8_data["coll_severity_num_mean"].mean()
-) / fig8_data["coll_severity_num_mean"].std()
+# Calculate z-scores for standardization (equivalent to R's scale function), column-wise on the underlying NumPy array
+# (NaN-aware sample mean and standard deviation, matching the pandas defaults)
+fig8_values = fig8_data[["victims", "severity"]].to_numpy(dtype = float)
+fig8_zscores = (fig8_values - np.nanmean(fig8_values, axis = 0)) / np.nanstd(fig8_values, axis = 0, ddof = 1)
 
-# Rename columns for clarity
-fig8_data.columns = ["time", "victims", "severity", "z_victims", "z_severity"]
+# Add the z-score columns (a single new frame, without an intermediate copy)
+fig8_data = fig8_data.assign(z_victims = fig8_zscores[:, 0], z_severity = fig8_zscores[:, 1])
 
 # Note 1: The z-scores are calculated for the raw and trend values of the number of victims and mean collision severity. The reason is for enabling standardized scale comparison between the two variables in the plot.
 
 # Note 2: We will use the z-score transformations both on the scaled (z = (x - mean(x)) / sd(x)) and inverse scaled (x = z * sd(x) + mean(x)) values of the raw and trend data for the number of victims and mean collision severity, in order to adjust the axes scales of the plot.
 
+# Compute the LOESS trends and their 95% confidence bounds once (passed to the plotting function below)
+fig8_trends = octr.compute_overlay_trends(fig8_data)
+
 # Example usage of the function with the data we prepared above
 # create_victims_severity_plot(fig8_data, save_path="figure8_victims_vs_severity.png")
 fig8, ax1, ax2 = octr.create_victims_severity_plot(
     fig8_data,
+    trends = fig8_trends,
     show_plot = False
 )
 
-# Show the figure
-fig8.show()
+# Show the figure (interactive runs only)
+if not BATCH_MODE:
+    fig8.show()
 #plt.close(fig8)
 
 
@@ -748,6 +760,7 @@ fig8.savefig(
     facecolor = "auto",
     edgecolor = "auto",
     backend = None,
+    pil_kwargs = PNG_KWARGS,
 )
 plt.close(fig8)
 
@@ -788,8 +801,9 @@ print("\n- Create the Median Age Figure")
 
 # Create the age pyramid plot for parties and victims
 fig9 = octr.create_age_pyramid_plot(collisions)
-# Show the figure
-fig9.show()
+# Show the figure (interactive runs only)
+if not BATCH_MODE:
+    fig9.show()
 # close the figure to free memory
 #plt.close(fig)  # Close the figure to free memory
 
@@ -810,6 +824,7 @@ fig9.savefig(
     facecolor = "auto",
     edgecolor = "auto",
     backend = None,
+    pil_kwargs = PNG_KWARGS,
 )
 
 plt.close(fig9)  # Close the figure to free memory
@@ -820,11 +835,12 @@ plt.close(fig9)  # Close the figure to free memory
 #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 print("\n3. Save the Time Series Data")
 
-# Save the data to disk
+# Save the data to disk (only the graphics metadata, the one artifact this script updates; the collision data frames,
+# codebook and time series are only read here, and the figures and STL results are not saved, so nothing else is pickled again)
 octr.save_to_disk(
     dir_list = prj_dirs,
-    local_vars = locals(),
-    global_vars = globals()
+    local_vars = {"graphics_list": graphics_list},
+    global_vars = {}
 )
 
 